@@ -6,12 +6,18 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 from typing import Dict, List, Optional
 import time
 
 
+# 所有客户端共用的连接池：各客户端保留自己的Session（请求头不同），
+# 但复用同一批到币安的TCP/TLS连接，避免每个客户端重新握手
+_SHARED_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+
+
 class BinanceAPIClient:
     """币安API客户端类"""
     
@@ -29,6 +35,7 @@ class BinanceAPIClient:
     def __init__(self):
         """初始化API客户端"""
         self.session = requests.Session()
+        self.session.mount('https://', _SHARED_ADAPTER)
         self.session.headers.update({
             'Content-Type': 'application/json',
             'User-Agent': 'BinanceDesktopApp/1.0'
@@ -57,11 +64,19 @@ class BinanceAPIClient:
                 return response.json()
             else:
                 self.connection_status = 'error'
-                return {
+                error = {
                     'error': True,
                     'status_code': response.status_code,
                     'message': response.text
                 }
+                # 限流(429)/封禁(418)时币安通过Retry-After告知等待秒数
+                retry_after = response.headers.get('Retry-After')
+                if retry_after:
+                    try:
+                        error['retry_after'] = float(retry_after)
+                    except ValueError:
+                        pass
+                return error
                 
         except requests.exceptions.Timeout:
             self.connection_status = 'timeout'
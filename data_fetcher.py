@@ -6,14 +6,29 @@
 """
 
 import time
+import random
+import logging
+import threading
+from itertools import repeat
 from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
+import requests
 from binance_api_client import BinanceAPIClient
+from exceptions import TradingSystemError, APIError, DataFetchError
+
+logger = logging.getLogger(__name__)
+
+# 可恢复的数据获取错误（交易所错误、网络异常、返回数据格式异常）
+RECOVERABLE_ERRORS = (TradingSystemError, requests.RequestException, ValueError, KeyError)
 
 
 class MarketData:
     """市场数据类（K线数据）"""
     
+    # 每次获取会创建大量实例，使用__slots__省去实例__dict__
+    __slots__ = ('symbol', 'timeframe', 'open_time', 'open', 'high',
+                 'low', 'close', 'volume', 'close_time')
+    
     def __init__(self, 
                  symbol: str,
                  timeframe: str = '5m',
@@ -85,9 +100,28 @@ class MarketData:
         }
 
 
+class _InflightRequest:
+    """进行中的K线请求（等待的线程从中取得发起线程的结果或异常）"""
+    
+    __slots__ = ('event', 'limit', 'result', 'error')
+    
+    def __init__(self, limit: int):
+        self.event = threading.Event()
+        self.limit = limit  # 发起线程请求的数量
+        self.result: Optional[List[MarketData]] = None
+        self.error: Optional[Exception] = None
+
+
 class DataFetcher:
     """数据获取器 - 负责获取所有市场数据"""
     
+    # API端点
+    ENDPOINTS = {
+        'klines': '/fapi/v1/klines',                 # K线
+        'premium_index': '/fapi/v1/premiumIndex',    # 标记价格与资金费率
+        'ticker_24h': '/fapi/v1/ticker/24hr',        # 24小时价格变动
+    }
+    
     def __init__(self, api_client: BinanceAPIClient):
         """
         初始化数据获取器
@@ -97,12 +131,123 @@ class DataFetcher:
         """
         self.api_client = api_client
         self.cache: Dict[str, Dict] = {}
-        self.last_update_time: Dict[str, datetime] = {}
+        self.last_update_time: Dict[str, float] = {}  # time.monotonic()时间戳
         self.cache_ttl_seconds = 10  # 缓存10秒
+        # 多个线程共用同一实例：cache和last_update_time成对读写，统一在此锁内进行
+        self._cache_lock = threading.Lock()
+        self.retry_base_delay = 0.25  # 重试初始延迟（秒）
+        self.retry_max_delay = 30.0   # 重试最大延迟（秒）
+        self.incremental_kline_limit = 100  # 增量刷新每次请求的K线数（与调用方的limit无关）
+        
+        # 服务器时间与本地时钟的偏移（毫秒）
+        self.server_time_ttl_seconds = 60
+        self._server_time_offset_ms: Optional[int] = None
+        self._server_time_synced_at = 0.0
+        
+        # 进行中的请求 {cache_key: _InflightRequest}，用于合并并发的相同请求
+        self._inflight: Dict[str, _InflightRequest] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # 按交易对缓存的只读请求参数 {symbol: {'symbol': symbol}}
+        self._symbol_params: Dict[str, Dict] = {}
+    
+    def _get_symbol_params(self, symbol: str) -> Dict:
+        """
+        获取仅包含交易对的请求参数（复用同一字典，调用方不得修改）
+        
+        Args:
+            symbol: 交易对
+            
+        Returns:
+            请求参数字典
+        """
+        params = self._symbol_params.get(symbol)
+        if params is None:
+            params = self._symbol_params[symbol] = {'symbol': symbol}
+        return params
+    
+    def _get_cached_klines(self, cache_key: str, limit: int) -> Optional[List[MarketData]]:
+        """
+        读取未过期且数量足够的缓存K线
+        
+        Args:
+            cache_key: 缓存键
+            limit: 需要的K线数量
+            
+        Returns:
+            最近limit根K线，缓存不存在、已过期或数量不足时返回None
+        """
+        cached = self._get_cached(cache_key)
+        if cached is None or len(cached) < limit:
+            return None
+        return cached if len(cached) == limit else cached[-limit:]
+    
+    def _get_cached(self, cache_key: str):
+        """
+        读取未过期的缓存
+        
+        Args:
+            cache_key: 缓存键
+            
+        Returns:
+            缓存数据，不存在或已过期时返回None
+        """
+        with self._cache_lock:
+            last_update = self.last_update_time.get(cache_key)
+            data = self.cache.get(cache_key)
+        if last_update is not None and data is not None:
+            if time.monotonic() - last_update < self.cache_ttl_seconds:
+                return data
+        return None
+    
+    @staticmethod
+    def _check_response(result, action: str):
+        """
+        检查API响应，出错时抛出APIError
+        
+        Args:
+            result: _make_request返回的数据
+            action: 操作描述（用于错误信息）
+        """
+        if isinstance(result, dict) and result.get('error'):
+            raise APIError(
+                f"{action}失败: {result.get('message')}",
+                status_code=result.get('status_code'),
+                retry_after=result.get('retry_after')
+            )
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        判断错误是否值得重试
+        
+        4xx请求错误（429限流除外）重试结果不会改变，直接放弃
+        """
+        status_code = getattr(error, 'status_code', None)
+        if status_code is None:
+            return True
+        return status_code == 429 or not (400 <= status_code < 500)
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        计算指数退避延迟（带随机抖动）
+        
+        Args:
+            attempt: 当前重试序号（从0开始）
+            retry_after: 服务端要求的等待秒数（Retry-After）
+            
+        Returns:
+            延迟秒数
+        """
+        delay = min(self.retry_max_delay, (2 ** attempt) * self.retry_base_delay)
+        delay += random.uniform(0, delay * 0.5)
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
     
     def _retry_request(self, func, *args, max_retries=3, **kwargs):
         """
-        可重试的请求
+        可重试的请求（指数退避 + 随机抖动）
         
         Args:
             func: 要执行的函数
@@ -114,10 +259,87 @@ class DataFetcher:
         for attempt in range(max_retries):
             try:
                 return func(*args, **kwargs)
-            except Exception as e:
-                if attempt == max_retries - 1:
+            except RECOVERABLE_ERRORS as e:
+                if attempt == max_retries - 1 or not self._is_retryable(e):
                     raise
-                time.sleep(1 * (attempt + 1))  # 递增延迟
+                time.sleep(self._backoff_delay(attempt, getattr(e, 'retry_after', None)))
+    
+    def _fetch_klines(self,
+                      symbol: str,
+                      interval: str,
+                      limit: int,
+                      start_time: Optional[int] = None) -> List[MarketData]:
+        """
+        从交易所获取K线数据（不经过缓存）
+        
+        Args:
+            symbol: 交易对
+            interval: K线周期
+            limit: 获取数量
+            start_time: 起始时间（毫秒），为None时获取最近的K线
+            
+        Returns:
+            K线数据列表
+        """
+        params = {
+            'symbol': symbol,
+            'interval': interval,
+            'limit': limit
+        }
+        if start_time is not None:
+            params['startTime'] = start_time
+        result = self.api_client._make_request(self.ENDPOINTS['klines'], params=params)
+        
+        # 检查是否出错
+        self._check_response(result, "获取K线")
+        
+        # 检查是否是有效的数据列表
+        if not isinstance(result, list):
+            raise DataFetchError(symbol, interval, "返回数据格式错误")
+        
+        if not result:
+            return []
+        
+        # 按列整体转换为MarketData对象，避免逐行逐字段调用float()
+        count = len(result)
+        columns = list(zip(*result))
+        return list(map(
+            MarketData,
+            repeat(symbol, count),
+            repeat(interval, count),
+            columns[0],
+            map(float, columns[1]),
+            map(float, columns[2]),
+            map(float, columns[3]),
+            map(float, columns[4]),
+            map(float, columns[5]),
+            columns[6]
+        ))
+    
+    @staticmethod
+    def _merge_klines(klines: List[MarketData], new_klines: List[MarketData]) -> List[MarketData]:
+        """
+        将增量K线拼接到已有K线之后，保持原有长度
+        
+        新数据中与已有K线重叠的部分（通常是尚未收盘的最后一根）以新数据为准
+        
+        Args:
+            klines: 已有K线（按时间升序）
+            new_klines: 增量K线（按时间升序）
+            
+        Returns:
+            拼接后的K线列表
+        """
+        if not new_klines:
+            return klines
+        
+        first_open_time = new_klines[0].open_time
+        keep = len(klines)
+        while keep > 0 and klines[keep - 1].open_time >= first_open_time:
+            keep -= 1
+        
+        merged = klines[:keep] + new_klines
+        return merged[-len(klines):]
     
     def get_klines(self, 
                    symbol: str, 
@@ -136,54 +358,67 @@ class DataFetcher:
         """
         cache_key = f"klines_{symbol}_{interval}"
         
-        # 检查缓存
-        if cache_key in self.cache:
-            last_update = self.last_update_time.get(cache_key, datetime.min)
-            if (datetime.now() - last_update).total_seconds() < self.cache_ttl_seconds:
-                return self.cache[cache_key]
-        
-        # 获取数据
-        def fetch():
-            endpoint = '/fapi/v1/klines'
-            params = {
-                'symbol': symbol,
-                'interval': interval,
-                'limit': limit
-            }
-            result = self.api_client._make_request(endpoint, params=params)
-            
-            # 检查是否出错
-            if isinstance(result, dict) and result.get('error'):
-                raise Exception(f"获取K线失败: {result.get('message')}")
-            
-            # 检查是否是有效的数据列表
-            if not isinstance(result, list):
-                raise Exception(f"获取K线失败: 返回数据格式错误")
+        while True:
+            # 检查缓存
+            cached = self._get_cached_klines(cache_key, limit)
+            if cached is not None:
+                return cached
             
-            # 转换为MarketData对象
-            klines = []
-            for kline in result:
-                klines.append(MarketData(
-                    symbol=symbol,
-                    timeframe=interval,
-                    open_time=kline[0],
-                    open_price=float(kline[1]),
-                    high=float(kline[2]),
-                    low=float(kline[3]),
-                    close=float(kline[4]),
-                    volume=float(kline[5]),
-                    close_time=kline[6]
-                ))
+            # 相同数据的并发请求只发起一次，其余线程等待其结果
+            with self._inflight_lock:
+                request = self._inflight.get(cache_key)
+                if request is None:
+                    request = self._inflight[cache_key] = _InflightRequest(limit)
+                    break
             
-            return klines
-        
-        klines = self._retry_request(fetch)
+            request.event.wait()
+            # 发起线程失败时直接抛出同一异常，不再各自重新请求
+            if request.error is not None:
+                raise request.error
+            klines = request.result
+            if klines is None:
+                # 发起线程因非Exception异常（如SystemExit）退出，没有结果也没有可转发的错误，重新进入
+                continue
+            if len(klines) >= limit or request.limit >= limit:
+                return klines if len(klines) <= limit else klines[-limit:]
+            # 发起线程请求的数量不足本次所需，重新进入（只有一个线程会再次请求）
         
-        # 更新缓存
-        self.cache[cache_key] = klines
-        self.last_update_time[cache_key] = datetime.now()
-        
-        return klines
+        try:
+            with self._cache_lock:
+                stale = self.cache.get(cache_key)
+            if stale and len(stale) >= limit:
+                # 增量刷新：只拉取最后一根缓存K线及之后的数据并拼接
+                page_size = self.incremental_kline_limit
+                new_klines = self._retry_request(
+                    self._fetch_klines, symbol, interval, page_size,
+                    start_time=stale[-1].open_time
+                )
+                # 第一根与缓存最后一根相同才能衔接；整页返回说明之后可能还有数据
+                if (new_klines and new_klines[0].open_time == stale[-1].open_time
+                        and len(new_klines) < page_size):
+                    klines = self._merge_klines(stale, new_klines)
+                else:
+                    # 间隔过久，增量数据无法衔接，按缓存长度重新全量获取
+                    klines = self._retry_request(self._fetch_klines, symbol, interval, len(stale))
+            else:
+                klines = self._retry_request(self._fetch_klines, symbol, interval, limit)
+            
+            # 更新缓存（不会用更短的序列覆盖更长的缓存）
+            if not stale or len(klines) >= len(stale):
+                with self._cache_lock:
+                    self.cache[cache_key] = klines
+                    self.last_update_time[cache_key] = time.monotonic()
+        except Exception as e:
+            request.error = e
+            raise
+        else:
+            request.result = klines
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            request.event.set()
+        
+        return klines if len(klines) <= limit else klines[-limit:]
     
     def get_funding_rate(self, symbol: str) -> Optional[float]:
         """
@@ -196,18 +431,20 @@ class DataFetcher:
             资金费率
         """
         def fetch():
-            endpoint = '/fapi/v1/premiumIndex'
-            params = {'symbol': symbol}
-            result = self.api_client._make_request(endpoint, params=params)
+            result = self.api_client._make_request(
+                self.ENDPOINTS['premium_index'], params=self._get_symbol_params(symbol)
+            )
             
-            if result.get('error'):
-                raise Exception(f"获取资金费率失败: {result.get('message')}")
+            self._check_response(result, "获取资金费率")
+            if not isinstance(result, dict):
+                raise DataFetchError(symbol, 'premiumIndex', "返回数据格式错误")
             
             return float(result.get('lastFundingRate', 0.0))
         
         try:
             return self._retry_request(fetch)
-        except:
+        except RECOVERABLE_ERRORS:
+            logger.warning("获取 %s 资金费率失败", symbol, exc_info=True)
             return None
     
     def get_price_and_spread(self, symbol: str) -> Tuple[float, float]:
@@ -222,12 +459,13 @@ class DataFetcher:
         """
         def fetch():
             # 获取24小时ticker数据
-            endpoint = '/fapi/v1/ticker/24hr'
-            params = {'symbol': symbol}
-            result = self.api_client._make_request(endpoint, params=params)
+            result = self.api_client._make_request(
+                self.ENDPOINTS['ticker_24h'], params=self._get_symbol_params(symbol)
+            )
             
-            if result.get('error'):
-                raise Exception(f"获取价格失败: {result.get('message')}")
+            self._check_response(result, "获取价格")
+            if not isinstance(result, dict):
+                raise DataFetchError(symbol, 'ticker', "返回数据格式错误")
             
             price = float(result.get('lastPrice', 0))
             spread = float(result.get('askPrice', price)) - float(result.get('bidPrice', price))
@@ -236,7 +474,8 @@ class DataFetcher:
         
         try:
             return self._retry_request(fetch)
-        except:
+        except RECOVERABLE_ERRORS:
+            logger.warning("获取 %s 价格和点差失败", symbol, exc_info=True)
             return (0.0, 0.0)
     
     def get_atr(self, symbol: str, interval: str = '5m', period: int = 14) -> float:
@@ -256,6 +495,8 @@ class DataFetcher:
         if len(klines) < period + 1:
             return 0.0
         
+        # 缓存中可能有更多K线，只取最近period+1根
+        klines = klines[-(period + 1):]
         true_ranges = []
         for i in range(1, len(klines)):
             prev_kline = klines[i-1]
@@ -289,8 +530,8 @@ class DataFetcher:
         if len(klines) < period:
             return 0.0
         
-        volumes = [k.volume for k in klines[:period]]
-        return sum(volumes) / len(volumes)
+        # K线按时间升序排列，取最近period根
+        return sum(k.volume for k in klines[-period:]) / period
     
     def get_latest_price(self, symbol: str) -> float:
         """
@@ -304,7 +545,7 @@ class DataFetcher:
         """
         klines = self.get_klines(symbol, interval='1m', limit=1)
         if klines:
-            return klines[0].close
+            return klines[-1].close
         return 0.0
     
     def get_data_freshness(self, symbol: str) -> int:
@@ -317,18 +558,61 @@ class DataFetcher:
         Returns:
             数据延迟秒数
         """
-        klines = self.get_klines(symbol, interval='1m', limit=1)
-        if not klines:
+        # 直接使用该标的最近更新过的缓存K线，不再单独请求1m K线
+        # 其他线程可能同时写入缓存，在锁内取快照后再比较
+        prefix = f"klines_{symbol}_"
+        with self._cache_lock:
+            entries = [
+                (cache_key, update_time, self.cache.get(cache_key))
+                for cache_key, update_time in self.last_update_time.items()
+                if cache_key.startswith(prefix)
+            ]
+        
+        latest_key = None
+        latest_time = None
+        latest_klines = None
+        for cache_key, update_time, klines in entries:
+            if not klines:
+                continue
+            if latest_time is None or update_time > latest_time:
+                latest_key, latest_time, latest_klines = cache_key, update_time, klines
+        
+        if latest_key is None:
             return 999
         
-        close_time = klines[0].close_time
-        current_time = int(datetime.now().timestamp() * 1000)
+        close_time = latest_klines[-1].close_time
+        if self._get_cached(latest_key) is not None:
+            current_time = int(time.time() * 1000)
+        else:
+            # 缓存已过期，以服务器时间为准计算延迟
+            current_time = self._get_server_time_ms()
         return (current_time - close_time) // 1000
     
+    def _get_server_time_ms(self) -> int:
+        """
+        获取服务器时间（毫秒）
+        
+        与本地时钟的偏移缓存60秒，期间无需再次请求/fapi/v1/time
+        
+        Returns:
+            服务器时间戳（毫秒）
+        """
+        local_time = int(time.time() * 1000)
+        if (self._server_time_offset_ms is None or
+                time.monotonic() - self._server_time_synced_at >= self.server_time_ttl_seconds):
+            result = self.api_client.get_server_time()
+            if isinstance(result, dict) and not result.get('error') and 'serverTime' in result:
+                self._server_time_offset_ms = int(result['serverTime']) - local_time
+                self._server_time_synced_at = time.monotonic()
+            elif self._server_time_offset_ms is None:
+                return local_time
+        return local_time + self._server_time_offset_ms
+    
     def clear_cache(self):
         """清除缓存"""
-        self.cache.clear()
-        self.last_update_time.clear()
+        with self._cache_lock:
+            self.cache.clear()
+            self.last_update_time.clear()
     
     def get_klines_batch(self, 
                         symbols: List[str], 
@@ -439,7 +723,7 @@ class DataFetcher:
                 latest_price = self.get_latest_price(symbol)
                 
                 if latest_kline:
-                    latest_volume = latest_kline[0].volume
+                    latest_volume = latest_kline[-1].volume
                 else:
                     latest_volume = 0.0
                 
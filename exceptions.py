@@ -13,9 +13,10 @@ class TradingSystemError(Exception):
 
 class APIError(TradingSystemError):
     """API相关异常"""
-    def __init__(self, message: str, status_code: int = None):
+    def __init__(self, message: str, status_code: int = None, retry_after: float = None):
         self.message = message
         self.status_code = status_code
+        self.retry_after = retry_after
         super().__init__(self.message)
 
 
@@ -7,9 +7,17 @@ FVG流动性策略系统 - 图形界面
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-from datetime import datetime
+import tkinter.font as tkfont
+import ast
+from bisect import bisect_left
+from collections import deque
+import hashlib
+import os
+import queue
+import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from binance_api_client import BinanceAPIClient
 from binance_trading_client import BinanceTradingClient
@@ -20,21 +28,77 @@ from parameter_config import get_config, update_config
 from position_manager import Position
 
 
+# 监控统计项：(显示名称, 标签键, strategy_system.stats中的键, 格式化函数)
+# 统计键为None时显示监控标的数量
+_MONITOR_STATS_SPEC = (
+    ("循环次数", "total_loops", "total_loops", str),
+    ("发现共振", "confluences", "confluences_found", str),
+    ("执行交易", "trades", "trades_executed", str),
+    ("监控标的", "symbols", None, str),
+    ("分析周期", "timeframes", "timeframes_analyzed", str),
+)
+
+# 合约选择模式：(下拉框显示名称, 选择模式)，第一项为默认模式
+_SELECTION_MODE_OPTIONS = (
+    ("自动（综合评分）", SelectionMode.AUTO_SCORE),
+    ("自动（成交量）", SelectionMode.AUTO_VOLUME),
+    ("自动（波动率）", SelectionMode.AUTO_VOLATILITY),
+    ("手动", SelectionMode.MANUAL),
+)
+_SELECTION_MODE_BY_LABEL = dict(_SELECTION_MODE_OPTIONS)
+_SELECTION_MODE_LABELS = {mode: label for label, mode in _SELECTION_MODE_OPTIONS}
+
+# 界面命名字体：启动时各创建一次，组件通过名称引用
+_APP_FONTS = {
+    "AppBody": dict(family="Helvetica", size=10),
+    "AppBodyBold": dict(family="Helvetica", size=10, weight="bold"),
+    "AppText": dict(family="Helvetica", size=11),
+    "AppTextBold": dict(family="Helvetica", size=11, weight="bold"),
+    "AppLarge": dict(family="Helvetica", size=12),
+    "AppLargeBold": dict(family="Helvetica", size=12, weight="bold"),
+    "AppHeading": dict(family="Helvetica", size=14),
+    "AppHeadingBold": dict(family="Helvetica", size=14, weight="bold"),
+    "AppTitle": dict(family="Helvetica", size=24, weight="bold"),
+    "AppMono": dict(family="Courier", size=10),
+}
+
+
+def _parse_bool(text):
+    """将输入框文本解析为布尔值"""
+    return text.strip().lower() in ("true", "1", "yes")
+
+
+def _make_param_converter(current):
+    """
+    按配置项当前值的类型选择输入框文本的转换函数
+    
+    Args:
+        current: 配置项当前值（配置中不存在该项时为None）
+        
+    Returns:
+        转换函数（文本 -> 配置值）
+    """
+    if isinstance(current, bool):
+        return _parse_bool
+    if isinstance(current, (int, float)):
+        return type(current)
+    if isinstance(current, (list, dict)):
+        return ast.literal_eval
+    return str
+
+
 class FVGLiquidityGUI:
     """FVG流动性策略GUI应用"""
     
+    # 已初始化字体和样式的Tcl解释器 {解释器: 命名字体对象列表}
+    _interp_fonts = {}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("FVG流动性策略系统")
         
-        # 设置窗口大小和位置
-        window_width = 1400
-        window_height = 900
-        screen_width = root.winfo_screenwidth()
-        screen_height = root.winfo_screenheight()
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
-        self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        # 创建组件期间先隐藏窗口，全部创建完成后再按最终尺寸显示，只做一次布局
+        self.root.withdraw()
         
         # 设置窗口最小尺寸
         self.root.minsize(1200, 800)
@@ -42,6 +106,7 @@ class FVGLiquidityGUI:
         # 初始化组件
         self.api_client = BinanceAPIClient()
         self.trading_client = None
+        self._trading_clients = {}  # 按凭证缓存的交易客户端 {凭证摘要: 客户端}
         self.key_manager = APIKeyManager()
         self.strategy_system = None
         self.symbol_selector = None
@@ -50,16 +115,186 @@ class FVGLiquidityGUI:
         self.is_logged_in = False
         self.simulation_mode = tk.BooleanVar(value=True)
         self.selected_symbols = []
+        self._selected_symbol_set = set()  # 与selected_symbols同步，用于O(1)判断是否已选
+        self._selection_render_scheduled = False  # 是否已安排选中状态的重绘
         self.signals = []
         self.positions = []
         self.auto_update_running = False
+        self.signals_tree = None  # 信号标签页首次打开时创建
+        self.positions_tree = None  # 风险管理标签页首次打开时创建
+        self._positions_fetch_pending = False  # 是否有持仓查询正在后台执行
+        self.ui_update_interval_ms = 2000  # 界面刷新间隔（毫秒）
+        self._auto_update_job = None  # 下一次界面刷新的after任务
+        self.keepalive_interval_ms = 240000  # 登录后定时ping币安保持连接（毫秒）
+        self._keepalive_job = None
+        self._ping_pending = False  # 是否有ping在后台排队或执行
+        self.status_clear_delay_ms = 3000  # 状态栏提示自动清除的延迟（毫秒）
+        self._status_clear_job = None
+        self._signal_rows = {}  # 信号表格行 {symbol: (iid, values, confluence)}
+        self._widget_state = {}  # 组件最近一次设置的选项 {组件路径: {选项: 值}}
+        self._tree_values = {}  # 表格当前显示的行 {表格路径: [values, ...]}
+        self.bulk_insert_threshold = 100  # 一次插入超过该行数时先隐藏表格
+        
+        # 合约列表搜索
+        self._symbol_rows = []  # [(小写合约名, 行数据)]
+        self._symbol_data_rows = []  # 已格式化的数值列（合约数据变化时才重新生成）
+        self._symbol_keys = []  # 与_symbol_data_rows对应的小写合约名
+        self._symbol_display_cache = {}  # {合约: ((成交量, 涨跌幅, 评分), 已格式化的数值列)}
+        self._sorted_symbol_keys = []  # 排序后的小写合约名（前缀二分查找用）
+        self._sorted_symbol_positions = []  # 排序后各合约名在原列表中的下标
+        self.symbol_prefix_min_results = 5  # 前缀匹配少于该数量时改用包含匹配
+        self._symbol_search_pattern = (None, None)  # 通配符搜索 (关键字, 编译后的正则)
+        self._symbol_all_values = []  # 全部行数据（搜索框为空时直接使用）
+        self.symbol_search_delay_ms = 150  # 搜索防抖延迟（毫秒）
+        self._symbol_search_job = None
+        self._symbol_search_query = ""  # 当前生效的搜索关键字
+        self.selection_mode_delay_ms = 250  # 选择模式切换防抖延迟（毫秒）
+        self._selection_mode_job = None
+        self._symbol_view_rows = []  # 过滤后的全部行（表格中只显示其中一段）
+        self._symbol_view_start = 0  # 表格第一行对应的下标
+        self.symbol_view_size = 20  # 表格可完整显示的行数（随窗口大小更新）
+        self._symbol_row_metrics = None  # (首行顶部位置, 行高, 边框宽度)，首次有行显示时测量
+        
+        # 日志缓冲
+        self.max_log_lines = 2000  # 日志框最多保留行数
+        self.log_trim_batch = 500  # 超出上限时额外多删除的行数（避免每次刷新都删除）
+        self._log_line_count = 0  # 日志框当前行数
+        # 可在任意线程写入；超过上限时丢弃最早的未显示日志
+        self._log_queue = deque(maxlen=self.max_log_lines)
+        self._log_flush_scheduled = False
+        self._log_stamp = (None, "")  # (秒数, 该秒的时间戳字符串)，整体替换保证线程间一致
+        self._ui_thread_id = threading.get_ident()  # Tk主线程
+        
+        # 后台线程结果队列
+        self.ui_poll_interval_ms = 50  # 队列轮询间隔（毫秒，仅在不支持文件事件时使用）
+        self._init_ui_bridge()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # 创建界面
+        self._init_styles()
         self.create_widgets()
         
+        # 设置窗口大小和位置（居中）后显示窗口
+        window_width = 1400
+        window_height = 900
+        screen_width = root.winfo_screenwidth()
+        screen_height = root.winfo_screenheight()
+        x = (screen_width - window_width) // 2
+        y = (screen_height - window_height) // 2
+        self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        # 隐藏状态下先完成几何计算，窗口映射后直接按最终布局绘制
+        self.root.update_idletasks()
+        self.root.deiconify()
+        
         # 加载保存的API密钥
         self.load_saved_credentials()
     
+    def _init_ui_bridge(self):
+        """
+        初始化后台线程到主线程的结果队列
+        
+        后台线程不直接操作Tk，而是把(回调, 参数)放入队列；支持文件事件时
+        通过管道唤醒主线程，否则退回定时轮询
+        """
+        # SimpleQueue无任务计数，put/get开销更小且put可重入（Python 3.7+）
+        self._ui_queue = getattr(queue, "SimpleQueue", queue.Queue)()
+        # 单个后台工作线程：登录、刷新等网络任务按提交顺序串行执行
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._ui_wakeup_fd = None
+        
+        try:
+            read_fd, write_fd = os.pipe()
+        except OSError:
+            self._poll_ui_queue()
+            return
+        
+        try:
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_ui_wakeup)
+        except (AttributeError, tk.TclError):
+            # 不支持文件事件（如Windows）
+            os.close(read_fd)
+            os.close(write_fd)
+            self._poll_ui_queue()
+        else:
+            self._ui_wakeup_fd = write_fd
+    
+    def _post_to_ui(self, callback, *args):
+        """
+        在主线程中执行回调（可在任意线程调用）
+        
+        Args:
+            callback: 回调函数
+            *args: 回调参数
+        """
+        self._ui_queue.put((callback, args))
+        if self._ui_wakeup_fd is not None:
+            os.write(self._ui_wakeup_fd, b"x")
+    
+    def _run_in_background(self, func, *args):
+        """
+        在后台工作线程中执行任务
+        
+        Args:
+            func: 任务函数（不得直接操作Tk，结果通过_post_to_ui返回）
+            *args: 任务参数
+        """
+        self._executor.submit(func, *args)
+    
+    def on_closing(self):
+        """关闭窗口：取消定时任务和排队中的后台任务后销毁窗口，不等待网络请求完成"""
+        for attr in ("_auto_update_job", "_keepalive_job", "_selection_mode_job", "_status_clear_job"):
+            job = getattr(self, attr)
+            if job is not None:
+                self.root.after_cancel(job)
+                setattr(self, attr, None)
+        try:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            # Python 3.9以前不支持cancel_futures
+            self._executor.shutdown(wait=False)
+        self.root.destroy()
+    
+    def _on_ui_wakeup(self, fd, mask):
+        """管道可读时处理队列中的回调"""
+        os.read(fd, 4096)
+        self._drain_ui_queue()
+    
+    def _poll_ui_queue(self):
+        """定时轮询队列（不支持文件事件时使用）"""
+        self._drain_ui_queue()
+        self.root.after(self.ui_poll_interval_ms, self._poll_ui_queue)
+    
+    def _drain_ui_queue(self):
+        """执行队列中所有待处理的回调"""
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(*args)
+            except Exception as e:
+                self.log(f"界面回调执行失败: {e}")
+    
+    def _init_styles(self):
+        """创建命名字体和ttk样式（每个解释器只创建一次）"""
+        self.style = ttk.Style(self.root)
+        
+        # 字体和样式属于整个解释器，同一root上再次创建窗口时直接复用
+        interp = self.root.tk
+        if interp in FVGLiquidityGUI._interp_fonts:
+            return
+        
+        # 保留字体对象引用，否则对象回收时Tk会删除同名字体
+        FVGLiquidityGUI._interp_fonts[interp] = [
+            tkfont.Font(root=self.root, name=name, **options)
+            for name, options in _APP_FONTS.items()
+        ]
+        
+        self.style.configure("TNotebook", background="#FFFFFF")
+        self.style.configure("TNotebook.Tab", background="#F5F5F5", foreground="#000000")
+        self.style.map("TNotebook.Tab", background=[("selected", "#FFFFFF")])
+    
     def create_widgets(self):
         """创建界面组件"""
         
@@ -67,23 +302,49 @@ class FVGLiquidityGUI:
         main_container = tk.Frame(self.root, bg="#FFFFFF")
         main_container.pack(fill=tk.BOTH, expand=True)
         
-        # 创建Notebook（标签页）
-        style = ttk.Style()
-        style.configure("TNotebook", background="#FFFFFF")
-        style.configure("TNotebook.Tab", background="#F5F5F5", foreground="#000000")
-        style.map("TNotebook.Tab", background=[("selected", "#FFFFFF")])
+        # 底部状态栏（操作成功的提示显示在这里，不弹出模态对话框）
+        self.status_banner = tk.Label(main_container, text="", font="AppBody", bg="#FFFFFF", anchor=tk.W)
+        self.status_banner.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 5))
         
+        # 创建Notebook（标签页）
         self.notebook = ttk.Notebook(main_container)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # 创建各个标签页
+        # 自动刷新时只更新当前显示的标签页 {标签页路径: 刷新函数}
+        self._tab_refreshers = {}
+        
+        # 创建各个标签页（登录、合约选择、监控立即创建，其余首次切换时创建）
         self.create_login_tab()
         self.create_symbol_tab()
         self.create_monitor_tab()
-        self.create_signals_tab()
-        self.create_risk_tab()
-        self.create_parameters_tab()
-        self.create_manual_tab()
+        
+        self._tab_builders = {}
+        lazy_tabs = [
+            ("🎯 信号", self.create_signals_tab, self.update_signals),
+            ("⚠️ 风险管理", self.create_risk_tab, self.update_positions),
+            ("⚙️ 参数配置", self.create_parameters_tab, None),
+            ("🎮 手动控制", self.create_manual_tab, None)
+        ]
+        for text, builder, refresher in lazy_tabs:
+            placeholder = tk.Frame(self.notebook, bg="#FFFFFF")
+            self.notebook.add(placeholder, text=text)
+            self._tab_builders[str(placeholder)] = (placeholder, builder)
+            if refresher is not None:
+                self._tab_refreshers[str(placeholder)] = refresher
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+    
+    def _on_tab_changed(self, event):
+        """首次切换到标签页时创建其内容；策略运行中切换时立即刷新该标签页"""
+        tab = self.notebook.select()
+        entry = self._tab_builders.pop(tab, None)
+        if entry:
+            placeholder, builder = entry
+            builder(placeholder)
+        
+        refresh = self._tab_refreshers.get(tab)
+        if refresh is not None and self.auto_update_running:
+            refresh()
     
     def create_login_tab(self):
         """创建登录标签页"""
@@ -98,7 +359,7 @@ class FVGLiquidityGUI:
         tk.Label(
             login_container,
             text="FVG流动性策略系统",
-            font=("Helvetica", 24, "bold"),
+            font="AppTitle",
             bg="#FFFFFF",
             fg="#000000"
         ).pack(pady=(0, 10))
@@ -106,7 +367,7 @@ class FVGLiquidityGUI:
         tk.Label(
             login_container,
             text="登录币安账户",
-            font=("Helvetica", 14),
+            font="AppHeading",
             bg="#FFFFFF",
             fg="#666666"
         ).pack(pady=(0, 50))
@@ -115,14 +376,14 @@ class FVGLiquidityGUI:
         tk.Label(
             login_container,
             text="API Key:",
-            font=("Helvetica", 12),
+            font="AppLarge",
             bg="#FFFFFF",
             fg="#000000"
         ).pack(anchor=tk.W)
         
         self.api_key_entry = tk.Entry(
             login_container,
-            font=("Helvetica", 11),
+            font="AppText",
             width=50
         )
         self.api_key_entry.pack(pady=(0, 20))
@@ -131,14 +392,14 @@ class FVGLiquidityGUI:
         tk.Label(
             login_container,
             text="API Secret:",
-            font=("Helvetica", 12),
+            font="AppLarge",
             bg="#FFFFFF",
             fg="#000000"
         ).pack(anchor=tk.W)
         
         self.api_secret_entry = tk.Entry(
             login_container,
-            font=("Helvetica", 11),
+            font="AppText",
             width=50,
             show="*"
         )
@@ -150,7 +411,7 @@ class FVGLiquidityGUI:
             login_container,
             text="保存凭证（加密存储）",
             variable=self.save_credentials_var,
-            font=("Helvetica", 10),
+            font="AppBody",
             bg="#FFFFFF",
             fg="#000000"
         ).pack(anchor=tk.W, pady=(0, 30))
@@ -162,7 +423,7 @@ class FVGLiquidityGUI:
             command=self.login,
             bg="#4CAF50",
             fg="white",
-            font=("Helvetica", 12, "bold"),
+            font="AppLargeBold",
             width=20,
             height=2
         )
@@ -172,7 +433,7 @@ class FVGLiquidityGUI:
         self.login_status_label = tk.Label(
             login_container,
             text="",
-            font=("Helvetica", 10),
+            font="AppBody",
             bg="#FFFFFF",
             fg="#666666"
         )
@@ -191,25 +452,21 @@ class FVGLiquidityGUI:
         tk.Label(
             control_frame,
             text="选择模式:",
-            font=("Helvetica", 11),
+            font="AppText",
             bg="#F5F5F5",
             fg="#000000"
         ).pack(side=tk.LEFT, padx=20, pady=15)
         
         # 选择模式下拉框
-        self.selection_mode_var = tk.StringVar(value="自动（综合评分）")
+        default_label, self._current_mode = _SELECTION_MODE_OPTIONS[0]
+        self.selection_mode_var = tk.StringVar(value=default_label)
         mode_combo = ttk.Combobox(
             control_frame,
             textvariable=self.selection_mode_var,
-            values=[
-                "自动（综合评分）",
-                "自动（成交量）",
-                "自动（波动率）",
-                "手动"
-            ],
+            values=[label for label, _ in _SELECTION_MODE_OPTIONS],
             state="readonly",
             width=20,
-            font=("Helvetica", 10)
+            font="AppBody"
         )
         mode_combo.pack(side=tk.LEFT, padx=10, pady=15)
         mode_combo.bind("<<ComboboxSelected>>", self.on_selection_mode_changed)
@@ -221,16 +478,43 @@ class FVGLiquidityGUI:
             command=self.refresh_symbols,
             bg="#2196F3",
             fg="white",
-            font=("Helvetica", 10, "bold"),
+            font="AppBodyBold",
             width=12
         )
         refresh_btn.pack(side=tk.LEFT, padx=20, pady=15)
         
+        # 搜索框
+        tk.Label(
+            control_frame,
+            text="搜索:",
+            font="AppText",
+            bg="#F5F5F5",
+            fg="#000000"
+        ).pack(side=tk.LEFT, padx=(10, 5), pady=15)
+        
+        self.symbol_search_entry = tk.Entry(
+            control_frame,
+            font="AppBody",
+            width=15
+        )
+        self.symbol_search_entry.pack(side=tk.LEFT, pady=15)
+        self.symbol_search_entry.bind("<KeyRelease>", self.on_symbol_search)
+        
+        self.symbol_prefix_only_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            control_frame,
+            text="精确前缀",
+            variable=self.symbol_prefix_only_var,
+            command=self._render_symbol_rows,
+            font="AppBody",
+            bg="#F5F5F5"
+        ).pack(side=tk.LEFT, padx=5, pady=15)
+        
         # 已选数量
         self.selected_count_label = tk.Label(
             control_frame,
             text="已选: 0",
-            font=("Helvetica", 11),
+            font="AppText",
             bg="#F5F5F5",
             fg="#000000"
         )
@@ -256,23 +540,33 @@ class FVGLiquidityGUI:
         self.symbol_tree.column("score", width=100, anchor=tk.CENTER)
         self.symbol_tree.column("selected", width=80, anchor=tk.CENTER)
         
-        # 滚动条
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.symbol_tree.yview)
-        self.symbol_tree.configure(yscrollcommand=scrollbar.set)
+        # 滚动条（表格只保存可见的一段行，滚动位置由完整列表决定）
+        self.symbol_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self._on_symbol_scroll)
+        self.symbol_scrollbar.set(0, 1)
         
         self.symbol_tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.symbol_scrollbar.grid(row=0, column=1, sticky="ns")
         
         list_frame.grid_rowconfigure(0, weight=1)
         list_frame.grid_columnconfigure(0, weight=1)
         
         # 双击事件
         self.symbol_tree.bind("<Double-1>", self.on_symbol_double_click)
+        
+        # 鼠标滚轮（Windows/macOS使用MouseWheel，X11使用Button-4/5）和窗口大小变化
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.symbol_tree.bind(sequence, self._on_symbol_wheel)
+        self.symbol_tree.bind("<Configure>", self._on_symbol_tree_resize)
+        
+        # 键盘移动到窗口边缘时滚动列表
+        for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.symbol_tree.bind(sequence, self._on_symbol_key)
     
     def create_monitor_tab(self):
         """创建监控标签页"""
         monitor_frame = tk.Frame(self.notebook, bg="#FFFFFF")
         self.notebook.add(monitor_frame, text="📈 监控")
+        self._tab_refreshers[str(monitor_frame)] = self.update_stats
         
         # 顶部控制栏
         control_frame = tk.Frame(monitor_frame, bg="#F5F5F5", height=60)
@@ -284,7 +578,7 @@ class FVGLiquidityGUI:
             control_frame,
             text="模拟模式",
             variable=self.simulation_mode,
-            font=("Helvetica", 11),
+            font="AppText",
             bg="#F5F5F5",
             fg="#000000"
         ).pack(side=tk.LEFT, padx=20, pady=15)
@@ -296,7 +590,7 @@ class FVGLiquidityGUI:
             command=self.toggle_strategy,
             bg="#4CAF50",
             fg="white",
-            font=("Helvetica", 11, "bold"),
+            font="AppTextBold",
             width=15,
             height=2
         )
@@ -306,7 +600,7 @@ class FVGLiquidityGUI:
         self.system_status_label = tk.Label(
             control_frame,
             text="状态: 未启动",
-            font=("Helvetica", 11, "bold"),
+            font="AppTextBold",
             bg="#F5F5F5",
             fg="#666666"
         )
@@ -317,50 +611,53 @@ class FVGLiquidityGUI:
         stats_frame.pack(fill=tk.X, padx=10, pady=10)
         
         self.stats_labels = {}
-        stats_info = [
-            ("循环次数", "total_loops"),
-            ("发现共振", "confluences"),
-            ("执行交易", "trades"),
-            ("监控标的", "symbols"),
-            ("分析周期", "timeframes")
-        ]
+        # 更新时直接遍历(标签, 统计键, 格式化函数)，无需逐项查找
+        self._stats_bindings = []
         
-        for i, (label_text, key) in enumerate(stats_info):
-            frame = tk.Frame(stats_frame, bg="#FFFFFF")
-            frame.pack(side=tk.LEFT, padx=20)
-            
+        # 每项占一列：第0行为名称，第1行为数值（直接网格布局，无需每项单独的Frame）
+        for column, (label_text, key, stats_key, formatter) in enumerate(_MONITOR_STATS_SPEC):
             tk.Label(
-                frame,
+                stats_frame,
                 text=label_text,
-                font=("Helvetica", 10),
+                font="AppBody",
                 bg="#FFFFFF",
                 fg="#666666"
-            ).pack()
+            ).grid(row=0, column=column, padx=20)
             
             self.stats_labels[key] = tk.Label(
-                frame,
+                stats_frame,
                 text="0",
-                font=("Helvetica", 14, "bold"),
+                font="AppHeadingBold",
                 bg="#FFFFFF",
                 fg="#000000"
             )
-            self.stats_labels[key].pack()
+            self.stats_labels[key].grid(row=1, column=column, padx=20)
+            self._stats_bindings.append((self.stats_labels[key], stats_key, formatter))
         
         # 系统日志
         log_frame = tk.LabelFrame(monitor_frame, text="系统日志", padx=10, pady=10, bg="#FFFFFF")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # 只追加的纯文本日志：不换行（插入时无需重新计算折行），关闭撤销栈；
+        # 保留Text组件以便复制日志内容
         self.log_text = scrolledtext.ScrolledText(
             log_frame,
-            font=("Courier", 10),
-            wrap=tk.WORD
+            font="AppMono",
+            wrap=tk.NONE,
+            undo=False
         )
+        log_xscrollbar = ttk.Scrollbar(log_frame, orient=tk.HORIZONTAL, command=self.log_text.xview)
+        self.log_text.configure(xscrollcommand=log_xscrollbar.set)
+        log_xscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.log_text.pack(fill=tk.BOTH, expand=True)
     
-    def create_signals_tab(self):
-        """创建信号标签页"""
-        signals_frame = tk.Frame(self.notebook, bg="#FFFFFF")
-        self.notebook.add(signals_frame, text="🎯 信号")
+    def create_signals_tab(self, signals_frame):
+        """
+        创建信号标签页
+        
+        Args:
+            signals_frame: 标签页容器
+        """
         
         # 信号表格
         table_frame = tk.Frame(signals_frame, bg="#FFFFFF")
@@ -383,19 +680,22 @@ class FVGLiquidityGUI:
             self.signals_tree.column(col, anchor=tk.CENTER)
         
         # 滚动条
-        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.signals_tree.yview)
-        self.signals_tree.configure(yscrollcommand=scrollbar.set)
+        self.signals_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.signals_tree.yview)
+        self.signals_tree.configure(yscrollcommand=self.signals_scrollbar.set)
         
         self.signals_tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.signals_scrollbar.grid(row=0, column=1, sticky="ns")
         
         table_frame.grid_rowconfigure(0, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
     
-    def create_risk_tab(self):
-        """创建风险管理标签页"""
-        risk_frame = tk.Frame(self.notebook, bg="#FFFFFF")
-        self.notebook.add(risk_frame, text="⚠️ 风险管理")
+    def create_risk_tab(self, risk_frame):
+        """
+        创建风险管理标签页
+        
+        Args:
+            risk_frame: 标签页容器
+        """
         
         # 持仓表格
         positions_frame = tk.LabelFrame(risk_frame, text="当前持仓", padx=10, pady=10, bg="#FFFFFF")
@@ -418,19 +718,22 @@ class FVGLiquidityGUI:
             self.positions_tree.column(col, anchor=tk.CENTER)
         
         # 滚动条
-        scrollbar = ttk.Scrollbar(positions_frame, orient=tk.VERTICAL, command=self.positions_tree.yview)
-        self.positions_tree.configure(yscrollcommand=scrollbar.set)
+        self.positions_scrollbar = ttk.Scrollbar(positions_frame, orient=tk.VERTICAL, command=self.positions_tree.yview)
+        self.positions_tree.configure(yscrollcommand=self.positions_scrollbar.set)
         
         self.positions_tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.positions_scrollbar.grid(row=0, column=1, sticky="ns")
         
         positions_frame.grid_rowconfigure(0, weight=1)
         positions_frame.grid_columnconfigure(0, weight=1)
     
-    def create_parameters_tab(self):
-        """创建参数配置标签页"""
-        params_frame = tk.Frame(self.notebook, bg="#FFFFFF")
-        self.notebook.add(params_frame, text="⚙️ 参数配置")
+    def create_parameters_tab(self, params_frame):
+        """
+        创建参数配置标签页
+        
+        Args:
+            params_frame: 标签页容器
+        """
         
         # 创建滚动框架
         canvas = tk.Canvas(params_frame, bg="#FFFFFF")
@@ -449,7 +752,6 @@ class FVGLiquidityGUI:
         fvg_frame = tk.LabelFrame(scrollable_frame, text="FVG策略参数", padx=15, pady=15, bg="#FFFFFF")
         fvg_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.fvg_params = {}
         fvg_params = [
             ("timeframes", "分析周期", "['5m', '15m', '1h']"),
             ("primary_timeframe", "主周期", "5m"),
@@ -460,22 +762,12 @@ class FVGLiquidityGUI:
             ("min_rr_ratio", "最小盈亏比", "2.0")
         ]
         
-        for i, (key, label, default) in enumerate(fvg_params):
-            row_frame = tk.Frame(fvg_frame, bg="#FFFFFF")
-            row_frame.pack(fill=tk.X, pady=5)
-            
-            tk.Label(row_frame, text=label, width=20, anchor=tk.W, font=("Helvetica", 10), bg="#FFFFFF").pack(side=tk.LEFT)
-            
-            entry = tk.Entry(row_frame, font=("Helvetica", 10))
-            entry.insert(0, default)
-            entry.pack(side=tk.LEFT, padx=10)
-            self.fvg_params[key] = entry
+        self.fvg_params = self._create_param_rows(fvg_frame, "fvg_strategy", fvg_params)
         
         # 流动性分析参数
         liquidity_frame = tk.LabelFrame(scrollable_frame, text="流动性分析参数", padx=15, pady=15, bg="#FFFFFF")
         liquidity_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.liquidity_params = {}
         liquidity_params = [
             ("swing_period", "摆动点周期", "3"),
             ("liquidity_zone_lookback", "流动性区回溯", "100"),
@@ -483,22 +775,12 @@ class FVGLiquidityGUI:
             ("liquidity_range_percent", "流动性区范围", "0.2")
         ]
         
-        for i, (key, label, default) in enumerate(liquidity_params):
-            row_frame = tk.Frame(liquidity_frame, bg="#FFFFFF")
-            row_frame.pack(fill=tk.X, pady=5)
-            
-            tk.Label(row_frame, text=label, width=20, anchor=tk.W, font=("Helvetica", 10), bg="#FFFFFF").pack(side=tk.LEFT)
-            
-            entry = tk.Entry(row_frame, font=("Helvetica", 10))
-            entry.insert(0, default)
-            entry.pack(side=tk.LEFT, padx=10)
-            self.liquidity_params[key] = entry
+        self.liquidity_params = self._create_param_rows(liquidity_frame, "liquidity_analyzer", liquidity_params)
         
         # 风险管理参数
         risk_frame = tk.LabelFrame(scrollable_frame, text="风险管理参数", padx=15, pady=15, bg="#FFFFFF")
         risk_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.risk_params = {}
         risk_params = [
             ("max_drawdown_percent", "最大回撤%", "5"),
             ("max_consecutive_losses", "最大连续亏损", "3"),
@@ -508,16 +790,7 @@ class FVGLiquidityGUI:
             ("position_size_leverage", "杠杆倍数", "10")
         ]
         
-        for i, (key, label, default) in enumerate(risk_params):
-            row_frame = tk.Frame(risk_frame, bg="#FFFFFF")
-            row_frame.pack(fill=tk.X, pady=5)
-            
-            tk.Label(row_frame, text=label, width=20, anchor=tk.W, font=("Helvetica", 10), bg="#FFFFFF").pack(side=tk.LEFT)
-            
-            entry = tk.Entry(row_frame, font=("Helvetica", 10))
-            entry.insert(0, default)
-            entry.pack(side=tk.LEFT, padx=10)
-            self.risk_params[key] = entry
+        self.risk_params = self._create_param_rows(risk_frame, "risk_manager", risk_params)
         
         # 保存按钮
         save_btn = tk.Button(
@@ -526,7 +799,7 @@ class FVGLiquidityGUI:
             command=self.save_parameters,
             bg="#4CAF50",
             fg="white",
-            font=("Helvetica", 12, "bold"),
+            font="AppLargeBold",
             width=20,
             height=2
         )
@@ -535,49 +808,54 @@ class FVGLiquidityGUI:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
-    def create_manual_tab(self):
-        """创建手动控制标签页"""
-        manual_frame = tk.Frame(self.notebook, bg="#FFFFFF")
-        self.notebook.add(manual_frame, text="🎮 手动控制")
+    def _create_param_rows(self, parent, section, params):
+        """
+        创建一组参数输入行（标签和输入框直接按网格排列，不为每行单独建Frame）
+        
+        Args:
+            parent: 参数分组容器
+            section: 配置分区名称（按其中各项的类型确定转换函数）
+            params: [(参数名, 显示名称, 默认值)]
+            
+        Returns:
+            {参数名: (输入框, 转换函数)}
+        """
+        config_section = getattr(get_config(), section)
+        label_options = dict(width=20, anchor=tk.W, font="AppBody", bg="#FFFFFF")
+        entries = {}
+        for row, (key, label, default) in enumerate(params):
+            tk.Label(parent, text=label, **label_options).grid(row=row, column=0, sticky=tk.W, pady=5)
+            
+            entry = tk.Entry(parent, font="AppBody")
+            entry.insert(0, default)
+            entry.grid(row=row, column=1, sticky=tk.W, padx=10, pady=5)
+            entries[key] = (entry, _make_param_converter(getattr(config_section, key, None)))
+        return entries
+    
+    def create_manual_tab(self, manual_frame):
+        """
+        创建手动控制标签页
+        
+        Args:
+            manual_frame: 标签页容器
+        """
         
         # 控制按钮
         control_frame = tk.Frame(manual_frame, bg="#FFFFFF", padx=20, pady=20)
         control_frame.pack(fill=tk.X)
         
-        tk.Label(control_frame, text="策略控制", font=("Helvetica", 14, "bold"), bg="#FFFFFF", fg="#000000").pack(pady=(0, 15))
+        tk.Label(control_frame, text="策略控制", font="AppHeadingBold", bg="#FFFFFF", fg="#000000").pack(pady=(0, 15))
         
         buttons_frame = tk.Frame(control_frame, bg="#FFFFFF")
         buttons_frame.pack()
         
-        tk.Button(
-            buttons_frame,
-            text="⏸️ 暂停",
-            command=self.pause_strategy,
-            bg="#FF9800",
-            fg="white",
-            font=("Helvetica", 11, "bold"),
-            width=12
-        ).pack(side=tk.LEFT, padx=10)
-        
-        tk.Button(
-            buttons_frame,
-            text="▶️ 恢复",
-            command=self.resume_strategy,
-            bg="#4CAF50",
-            fg="white",
-            font=("Helvetica", 11, "bold"),
-            width=12
-        ).pack(side=tk.LEFT, padx=10)
-        
-        tk.Button(
-            buttons_frame,
-            text="⏹️ 停止",
-            command=self.stop_strategy,
-            bg="#F44336",
-            fg="white",
-            font=("Helvetica", 11, "bold"),
-            width=12
-        ).pack(side=tk.LEFT, padx=10)
+        button_options = dict(fg="white", font="AppTextBold", width=12)
+        for text, command, bg in (
+            ("⏸️ 暂停", self.pause_strategy, "#FF9800"),
+            ("▶️ 恢复", self.resume_strategy, "#4CAF50"),
+            ("⏹️ 停止", self.stop_strategy, "#F44336"),
+        ):
+            tk.Button(buttons_frame, text=text, command=command, bg=bg, **button_options).pack(side=tk.LEFT, padx=10)
         
         # 手动交易
         trade_frame = tk.LabelFrame(manual_frame, text="手动交易", padx=20, pady=20, bg="#FFFFFF")
@@ -586,17 +864,17 @@ class FVGLiquidityGUI:
         input_frame = tk.Frame(trade_frame, bg="#FFFFFF")
         input_frame.pack()
         
-        tk.Label(input_frame, text="合约:", font=("Helvetica", 10), bg="#FFFFFF", fg="#000000").grid(row=0, column=0, padx=5)
-        self.manual_symbol_entry = tk.Entry(input_frame, font=("Helvetica", 10), width=15)
+        tk.Label(input_frame, text="合约:", font="AppBody", bg="#FFFFFF", fg="#000000").grid(row=0, column=0, padx=5)
+        self.manual_symbol_entry = tk.Entry(input_frame, font="AppBody", width=15)
         self.manual_symbol_entry.grid(row=0, column=1, padx=5)
         self.manual_symbol_entry.insert(0, "BTCUSDT")
         
-        tk.Label(input_frame, text="方向:", font=("Helvetica", 10), bg="#FFFFFF", fg="#000000").grid(row=0, column=2, padx=5)
+        tk.Label(input_frame, text="方向:", font="AppBody", bg="#FFFFFF", fg="#000000").grid(row=0, column=2, padx=5)
         self.manual_side_var = tk.StringVar(value="BUY")
         ttk.Combobox(input_frame, textvariable=self.manual_side_var, values=["BUY", "SELL"], state="readonly", width=10).grid(row=0, column=3, padx=5)
         
-        tk.Label(input_frame, text="数量:", font=("Helvetica", 10), bg="#FFFFFF", fg="#000000").grid(row=0, column=4, padx=5)
-        self.manual_size_entry = tk.Entry(input_frame, font=("Helvetica", 10), width=10)
+        tk.Label(input_frame, text="数量:", font="AppBody", bg="#FFFFFF", fg="#000000").grid(row=0, column=4, padx=5)
+        self.manual_size_entry = tk.Entry(input_frame, font="AppBody", width=10)
         self.manual_size_entry.grid(row=0, column=5, padx=5)
         self.manual_size_entry.insert(0, "0.001")
         
@@ -606,7 +884,7 @@ class FVGLiquidityGUI:
             command=self.manual_open_position,
             bg="#2196F3",
             fg="white",
-            font=("Helvetica", 10, "bold"),
+            font="AppBodyBold",
             width=10
         ).grid(row=0, column=6, padx=10)
         
@@ -616,24 +894,42 @@ class FVGLiquidityGUI:
             command=self.manual_close_position,
             bg="#F44336",
             fg="white",
-            font=("Helvetica", 10, "bold"),
+            font="AppBodyBold",
             width=10
         ).grid(row=0, column=7, padx=10)
     
     def load_saved_credentials(self):
-        """加载保存的凭证"""
+        """加载保存的凭证（读取和解密在后台执行，不阻塞窗口首次显示）"""
+        self._run_in_background(self._load_credentials_worker)
+    
+    def _load_credentials_worker(self):
+        """凭证加载工作线程"""
         try:
             saved = self.key_manager.load_credentials()
-            if saved:
-                # load_credentials 返回元组 (api_key, api_secret, passphrase)
-                api_key, api_secret, _ = saved
-                self.api_key_entry.delete(0, tk.END)
-                self.api_key_entry.insert(0, api_key)
-                self.api_secret_entry.delete(0, tk.END)
-                self.api_secret_entry.insert(0, api_secret)
-                self.save_credentials_var.set(True)
         except Exception as e:
-            self.log(f"加载凭证失败: {e}")
+            self._post_to_ui(self.log, f"加载凭证失败: {e}")
+            return
+        
+        if saved:
+            # load_credentials 返回元组 (api_key, api_secret, passphrase)
+            api_key, api_secret, _ = saved
+            self._post_to_ui(self._fill_saved_credentials, api_key, api_secret)
+    
+    def _fill_saved_credentials(self, api_key, api_secret):
+        """
+        将保存的凭证填入登录表单（主线程）
+        
+        用户已开始输入时不覆盖
+        
+        Args:
+            api_key: API Key
+            api_secret: API Secret
+        """
+        if self.api_key_entry.get() or self.api_secret_entry.get():
+            return
+        self.api_key_entry.insert(0, api_key)
+        self.api_secret_entry.insert(0, api_secret)
+        self.save_credentials_var.set(True)
     
     def login(self):
         """登录"""
@@ -644,83 +940,533 @@ class FVGLiquidityGUI:
             messagebox.showerror("错误", "请输入API Key和API Secret")
             return
         
+        self._configure_if_changed(self.login_status_label, text="登录中...", fg="#FF9800")
+        
+        # 网络请求在后台线程执行，避免界面卡顿
+        self._run_in_background(
+            self._login_worker, api_key, api_secret, self.save_credentials_var.get()
+        )
+    
+    def _login_worker(self, api_key, api_secret, save_credentials):
+        """登录工作线程（不直接操作界面，结果通过队列交给主线程）"""
         try:
-            self.login_status_label.config(text="登录中...", fg="#FF9800")
-            self.root.update()
-            
-            # 创建交易客户端
-            self.trading_client = BinanceTradingClient(api_key, api_secret)
+            # 同一凭证重复登录时复用已有客户端（保留其连接池）
+            trading_client = self._get_trading_client(api_key, api_secret)
             
             # 测试连接
-            account_info = self.trading_client.get_account_info()
+            account_info = trading_client.get_account_info()
             if account_info.get('error'):
-                raise Exception(account_info.get('msg', '连接失败'))
+                raise Exception(account_info.get('message', '连接失败'))
             
             # 保存凭证
-            if self.save_credentials_var.get():
+            if save_credentials:
                 self.key_manager.save_credentials(api_key, api_secret)
             
             # 初始化系统
-            self.strategy_system = FVGLiquidityStrategySystem(self.trading_client)
-            self.symbol_selector = SymbolSelector(self.api_client)
-            
-            self.is_logged_in = True
-            self.login_status_label.config(text="登录成功！", fg="#4CAF50")
+            strategy_system = FVGLiquidityStrategySystem(trading_client)
+            symbol_selector = SymbolSelector(self.api_client)
             
-            # 切换到合约选择标签页
-            self.notebook.select(1)
-            
-            # 加载合约列表
-            self.refresh_symbols()
-            
-            messagebox.showinfo("成功", "登录成功！")
+            # 加载合约列表（新建的选择器没有内存数据，可直接使用磁盘缓存）
+            symbol_selector.update_symbol_list()
             
         except Exception as e:
-            self.login_status_label.config(text=f"登录失败: {str(e)}", fg="#F44336")
-            messagebox.showerror("登录失败", str(e))
+            self._post_to_ui(self.on_login_failed, str(e))
+        else:
+            self._post_to_ui(self.on_login_success, trading_client, strategy_system, symbol_selector)
+    
+    def _get_trading_client(self, api_key, api_secret):
+        """
+        获取交易客户端（同一凭证只创建一次）
+        
+        只在后台工作线程中调用；缓存键为凭证的SHA256摘要
+        
+        Args:
+            api_key: API Key
+            api_secret: API Secret
+            
+        Returns:
+            交易客户端
+        """
+        key = hashlib.sha256(f"{api_key}:{api_secret}".encode("utf-8")).hexdigest()
+        client = self._trading_clients.get(key)
+        if client is None:
+            client = BinanceTradingClient(api_key, api_secret)
+            self._trading_clients[key] = client
+        return client
+    
+    def on_login_success(self, trading_client, strategy_system, symbol_selector):
+        """登录成功（主线程）"""
+        self.trading_client = trading_client
+        self.strategy_system = strategy_system
+        self.symbol_selector = symbol_selector
+        
+        self.is_logged_in = True
+        self._configure_if_changed(self.login_status_label, text="登录成功！", fg="#4CAF50")
+        self._schedule_keepalive()
+        
+        # 切换到合约选择标签页
+        self.notebook.select(1)
+        
+        # 显示合约列表
+        self.show_symbols()
+        
+        self.show_status("登录成功！")
+    
+    def show_status(self, message, fg="#4CAF50"):
+        """
+        在状态栏显示提示，status_clear_delay_ms后自动清除
+        
+        Args:
+            message: 提示内容
+            fg: 文字颜色
+        """
+        self._configure_if_changed(self.status_banner, text=message, fg=fg)
+        if self._status_clear_job is not None:
+            self.root.after_cancel(self._status_clear_job)
+        self._status_clear_job = self.root.after(self.status_clear_delay_ms, self._clear_status)
+    
+    def _clear_status(self):
+        """清除状态栏提示"""
+        self._status_clear_job = None
+        self._configure_if_changed(self.status_banner, text="")
+    
+    def _schedule_keepalive(self):
+        """安排下一次连接保活（主线程）"""
+        if self._keepalive_job is not None:
+            self.root.after_cancel(self._keepalive_job)
+        self._keepalive_job = self.root.after(self.keepalive_interval_ms, self._ping_binance)
+    
+    def _ping_binance(self):
+        """定时ping币安，避免空闲连接被服务端关闭后重新握手（上一次ping未完成时不重复提交）"""
+        self._keepalive_job = None
+        if not self._ping_pending:
+            self._ping_pending = True
+            self._run_in_background(self._ping_worker)
+        self._schedule_keepalive()
+    
+    def _ping_worker(self):
+        """连接保活工作线程"""
+        try:
+            self.api_client.ping()
+        except Exception:
+            pass  # 保活失败不影响使用，下次请求时会重新建立连接
+        finally:
+            self._post_to_ui(self._on_ping_done)
+    
+    def _on_ping_done(self):
+        """ping完成（主线程）"""
+        self._ping_pending = False
+    
+    def on_login_failed(self, message):
+        """登录失败（主线程）"""
+        self._configure_if_changed(self.login_status_label, text=f"登录失败: {message}", fg="#F44336")
+        messagebox.showerror("登录失败", message)
     
     def refresh_symbols(self):
-        """刷新合约列表"""
+        """刷新合约列表（后台获取，完成后在主线程显示）"""
+        if self.symbol_selector is None:
+            return
+        self._run_in_background(self._refresh_symbols_worker)
+    
+    def _refresh_symbols_worker(self):
+        """合约列表刷新工作线程"""
         try:
             self.symbol_selector.update_symbol_list(force_update=True)
-            symbols = self.symbol_selector.get_all_symbols()
-            
-            # 清空表格
-            for item in self.symbol_tree.get_children():
-                self.symbol_tree.delete(item)
-            
-            # 添加合约
-            for symbol_info in symbols:
-                # 使用属性访问，而不是下标访问（SymbolInfo是dataclass）
-                self.symbol_tree.insert("", tk.END, values=(
+        except Exception as e:
+            self._post_to_ui(self.on_refresh_symbols_failed, str(e))
+        else:
+            self._post_to_ui(self.show_symbols)
+    
+    def on_refresh_symbols_failed(self, message):
+        """合约列表刷新失败（主线程）"""
+        self.log(f"刷新合约列表失败: {message}")
+        messagebox.showerror("错误", f"刷新失败: {message}")
+    
+    def show_symbols(self):
+        """显示合约列表（合约数据更新后调用）"""
+        try:
+            count = self._format_symbol_data()
+            self._rebuild_symbol_rows()
+            self.log(f"已加载 {count} 个合约")
+        except Exception as e:
+            self.log(f"显示合约列表失败: {e}")
+    
+    def _format_symbol_data(self):
+        """
+        格式化合约的数值列（只在合约数据或评分变化时调用）
+        
+        Returns:
+            合约数量
+        """
+        symbols = self.symbol_selector.get_all_symbols()
+        
+        # 数值未变化的合约直接复用上次格式化的结果
+        # 使用属性访问，而不是下标访问（SymbolInfo是dataclass）
+        old_cache = self._symbol_display_cache
+        cache = {}
+        rows = []
+        for symbol_info in symbols:
+            numbers = (symbol_info.volume_24h, symbol_info.change_24h, symbol_info.score)
+            cached = old_cache.get(symbol_info.symbol)
+            if cached is not None and cached[0] == numbers:
+                data = cached[1]
+            else:
+                data = (
                     symbol_info.symbol,
                     f"{symbol_info.volume_24h:.0f}",
                     f"{abs(symbol_info.change_24h):.2f}%",
-                    f"{symbol_info.score:.2f}",
-                    "✓" if symbol_info.symbol in self.selected_symbols else "✗"
-                ))
+                    f"{symbol_info.score:.2f}"
+                )
+            cache[symbol_info.symbol] = (numbers, data)
+            rows.append(data)
+        self._symbol_display_cache = cache
+        self._symbol_data_rows = rows
+        
+        # 预先计算小写索引，搜索时无需逐次转换
+        keys = [symbol_info.symbol.lower() for symbol_info in symbols]
+        if keys == self._symbol_keys:
+            # 合约及顺序未变（如仅评分或行情变化），沿用已有的前缀索引
+            return len(symbols)
+        self._symbol_keys = keys
+        
+        # 前缀索引：按合约名排序，搜索时二分定位前缀范围
+        ordered = sorted(range(len(keys)), key=keys.__getitem__)
+        self._sorted_symbol_keys = [keys[i] for i in ordered]
+        self._sorted_symbol_positions = ordered
+        return len(symbols)
+    
+    def _rebuild_symbol_rows(self, keep_position=False):
+        """
+        用已格式化的数值列加上当前选中状态重建表格行（不访问网络，不重新格式化）
+        
+        Args:
+            keep_position: 是否保持当前滚动位置
+        """
+        selected = self._selected_symbol_set
+        rows = [data + ("✓" if data[0] in selected else "✗",) for data in self._symbol_data_rows]
+        
+        self._symbol_rows = list(zip(self._symbol_keys, rows))
+        self._symbol_all_values = rows
+        self._render_symbol_rows(keep_position)
+    
+    def _read_symbol_query(self):
+        """读取搜索关键字并统一为小写（与预先计算的小写合约名比较）"""
+        return self.symbol_search_entry.get().strip().lower()
+    
+    def _render_symbol_rows(self, keep_position=False, query=None):
+        """
+        按搜索关键字过滤并显示合约列表
+        
+        Args:
+            keep_position: 是否保持当前滚动位置（否则回到顶部）
+            query: 已规范化的搜索关键字（None表示从搜索框读取）
+        """
+        if query is None:
+            query = self._read_symbol_query()
+        self._symbol_search_query = query
+        if "*" in query or "?" in query:
+            # 通配符搜索：每个关键字只编译一次正则，逐行匹配在C中完成
+            match = self._get_symbol_pattern(query).search
+            rows = [values for key, values in self._symbol_rows if match(key)]
+        elif query:
+            # 先按前缀二分查找；结果太少且未勾选"精确前缀"时再做包含匹配
+            lo = bisect_left(self._sorted_symbol_keys, query)
+            hi = bisect_left(self._sorted_symbol_keys, query + "\uffff")
+            if hi - lo >= self.symbol_prefix_min_results or self.symbol_prefix_only_var.get():
+                all_values = self._symbol_all_values
+                rows = [all_values[i] for i in sorted(self._sorted_symbol_positions[lo:hi])]
+            else:
+                rows = [values for key, values in self._symbol_rows if query in key]
+        else:
+            # 搜索框为空时直接显示完整列表，无需逐行匹配
+            rows = self._symbol_all_values
+        self._symbol_view_rows = rows
+        self._show_symbol_window(self._symbol_view_start if keep_position else 0)
+    
+    def _get_symbol_pattern(self, query):
+        """
+        将通配符关键字转换为正则（*匹配任意字符，?匹配单个字符），相同关键字复用
+        
+        Args:
+            query: 含通配符的搜索关键字
             
-            self.log(f"已加载 {len(symbols)} 个合约")
+        Returns:
+            编译后的正则
+        """
+        cached_query, pattern = self._symbol_search_pattern
+        if cached_query != query:
+            regex = re.escape(query).replace(r"\*", ".*").replace(r"\?", ".")
+            pattern = re.compile(regex)
+            self._symbol_search_pattern = (query, pattern)
+        return pattern
+    
+    def _show_symbol_window(self, start):
+        """
+        显示从start开始的一屏合约，并同步滚动条位置
+        
+        Args:
+            start: 第一行在过滤后列表中的下标
+        """
+        total = len(self._symbol_view_rows)
+        size = self.symbol_view_size
+        start = max(0, min(start, total - size))
+        self._symbol_view_start = start
+        self._replace_tree_rows(self.symbol_tree, self._symbol_view_rows[start:start + size])
+        
+        if total:
+            self.symbol_scrollbar.set(start / total, min(start + size, total) / total)
+        else:
+            self.symbol_scrollbar.set(0, 1)
+        
+        # 首次有行显示时测量实际行高和表头高度，按测量结果重新计算行数
+        if self._symbol_row_metrics is None and self._measure_symbol_rows() and self._fit_symbol_view_size():
+            self._show_symbol_window(self._symbol_view_start)
+    
+    def _measure_symbol_rows(self):
+        """
+        测量合约表格首行的位置和行高（结果不变，测量成功后缓存）
+        
+        Returns:
+            是否已有测量结果
+        """
+        if self._symbol_row_metrics is None:
+            children = self.symbol_tree.get_children()
+            bbox = self.symbol_tree.bbox(children[0]) if children else ""
+            if bbox:
+                # bbox为(x, y, 宽, 高)：y为表头高度加上边框，x为边框宽度
+                self._symbol_row_metrics = (bbox[1], bbox[3], bbox[0])
+        return self._symbol_row_metrics is not None
+    
+    def _fit_symbol_view_size(self, height=None):
+        """
+        按表格高度重新计算可完整显示的行数（不计被截断的最后一行）
+        
+        Args:
+            height: 表格高度（像素），为None时读取当前高度
             
-        except Exception as e:
-            self.log(f"刷新合约列表失败: {e}")
-            messagebox.showerror("错误", f"刷新失败: {e}")
+        Returns:
+            行数是否发生变化
+        """
+        if height is None:
+            height = self.symbol_tree.winfo_height()
+        if self._measure_symbol_rows():
+            top, row_height, border = self._symbol_row_metrics
+        else:
+            # 尚未测量时按样式行高估算，表头按一行计
+            row_height = int(self.style.lookup("Treeview", "rowheight") or 20)
+            top, border = row_height, 0
+        size = max(1, (height - top - border) // row_height)
+        if size == self.symbol_view_size:
+            return False
+        self.symbol_view_size = size
+        return True
+    
+    def _on_symbol_scroll(self, action, amount, unit=None):
+        """
+        滚动条回调
+        
+        Args:
+            action: "moveto" 或 "scroll"
+            amount: moveto时为位置比例，scroll时为滚动步数
+            unit: scroll时为 "units" 或 "pages"
+        """
+        if action == "moveto":
+            start = int(float(amount) * len(self._symbol_view_rows))
+        else:
+            step = self.symbol_view_size if unit == "pages" else 1
+            start = self._symbol_view_start + int(amount) * step
+        self._show_symbol_window(start)
+    
+    def _on_symbol_wheel(self, event):
+        """鼠标滚轮滚动合约列表"""
+        delta = -3 if event.num == 4 or event.delta > 0 else 3
+        self._show_symbol_window(self._symbol_view_start + delta)
+        return "break"
+    
+    def _on_symbol_key(self, event):
+        """
+        方向键/翻页键超出当前显示的行时滚动列表，并保持焦点在边缘行
+        
+        窗口内的移动交给Treeview默认处理
+        """
+        tree = self.symbol_tree
+        children = tree.get_children()
+        if not children:
+            return None
+        
+        steps = {"Up": -1, "Down": 1, "Prior": -self.symbol_view_size, "Next": self.symbol_view_size}
+        step = steps[event.keysym]
+        focus = tree.focus()
+        target = (tree.index(focus) if focus else 0) + step
+        if 0 <= target < len(children):
+            return None
+        
+        old_start = self._symbol_view_start
+        self._show_symbol_window(old_start + step)
+        
+        # 窗口已到顶/底时落在第一行/最后一行
+        children = tree.get_children()
+        index = max(0, min(target - (self._symbol_view_start - old_start), len(children) - 1))
+        tree.selection_set(children[index])
+        tree.focus(children[index])
+        return "break"
+    
+    def _on_symbol_tree_resize(self, event):
+        """表格高度变化时重新计算可显示行数"""
+        if self._fit_symbol_view_size(event.height):
+            self._show_symbol_window(self._symbol_view_start)
+    
+    def on_symbol_search(self, event):
+        """搜索框输入（防抖：停止输入一段时间后才过滤）"""
+        if self._symbol_search_job is not None:
+            self.root.after_cancel(self._symbol_search_job)
+        self._symbol_search_job = self.root.after(self.symbol_search_delay_ms, self._apply_symbol_search)
+    
+    def _apply_symbol_search(self):
+        """执行合约搜索过滤（关键字未变化时不做任何处理）"""
+        self._symbol_search_job = None
+        query = self._read_symbol_query()
+        if query == self._symbol_search_query:
+            return
+        self._render_symbol_rows(query=query)
+    
+    def _suspend_yscroll(self, tree):
+        """
+        批量增删行前断开表格与滚动条的联动，避免每行都重新计算滚动条
+        
+        Args:
+            tree: 目标Treeview
+        """
+        tree.configure(yscrollcommand="")
+    
+    def _resume_yscroll(self, tree, scrollbar):
+        """
+        批量增删行后恢复滚动条联动，并按当前位置同步一次
+        
+        Args:
+            tree: 目标Treeview
+            scrollbar: 该表格的滚动条
+        """
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.set(*tree.yview())
+    
+    def _replace_tree_rows(self, tree, rows, scrollbar=None):
+        """
+        用新数据替换表格内容
+        
+        复用已有行且只更新内容变化的行，多余的行一次删除，不足的行批量插入，
+        重绘交给事件循环空闲时统一完成
+        
+        Args:
+            tree: 目标Treeview
+            rows: 行数据列表（每行为values元组）
+            scrollbar: 表格的滚动条（传入时在替换期间暂停滚动条联动）
+        """
+        children = tree.get_children()
+        shown = self._tree_values.get(str(tree))
+        if shown is None or len(shown) != len(children):
+            shown = [None] * len(children)
+        self._tree_values[str(tree)] = list(rows)
+        
+        # 只修改内容变化的行
+        changed = [(iid, values) for iid, old, values in zip(children, shown, rows) if old != values]
+        if not changed and len(children) == len(rows):
+            return
+        
+        if scrollbar is not None:
+            self._suspend_yscroll(tree)
+        
+        item = tree.item
+        for iid, values in changed:
+            item(iid, values=values)
+        
+        if len(children) > len(rows):
+            tree.delete(*children[len(rows):])
+        else:
+            # 大批量插入时先从布局中移除表格，插入完成后再显示，避免逐行重绘
+            new_rows = rows[len(children):]
+            hidden = len(new_rows) >= self.bulk_insert_threshold
+            if hidden:
+                tree.grid_remove()
+            insert = tree.insert
+            if children:
+                for values in new_rows:
+                    insert("", tk.END, values=values)
+            else:
+                # 空表时倒序插入到开头：Treeview定位"end"需遍历全部已有子项，
+                # 插入到位置0无需遍历
+                for values in reversed(new_rows):
+                    insert("", 0, values=values)
+            if hidden:
+                tree.grid()
+        
+        if scrollbar is not None:
+            self._resume_yscroll(tree, scrollbar)
     
     def on_selection_mode_changed(self, event):
-        """选择模式改变"""
-        mode_map = {
-            "自动（综合评分）": SelectionMode.SCORE,
-            "自动（成交量）": SelectionMode.VOLUME,
-            "自动（波动率）": SelectionMode.VOLATILITY,
-            "手动": SelectionMode.MANUAL
-        }
-        
-        mode = mode_map.get(self.selection_mode_var.get())
-        if mode and self.symbol_selector:
+        """选择模式改变（防抖：滚轮或键盘连续切换时只应用最后一次选择）"""
+        if self._selection_mode_job is not None:
+            self.root.after_cancel(self._selection_mode_job)
+        self._selection_mode_job = self.root.after(self.selection_mode_delay_ms, self._apply_selection_mode)
+    
+    def _apply_selection_mode(self):
+        """应用当前选择模式（模式未变化时不做任何处理）"""
+        self._selection_mode_job = None
+        mode = _SELECTION_MODE_BY_LABEL.get(self.selection_mode_var.get())
+        if mode is None or mode is self._current_mode or not self.symbol_selector:
+            return
+        previous_mode = self._current_mode
+        self._current_mode = mode
+        # 与合约列表刷新在同一个后台线程中修改选择器，避免并发修改
+        self._run_in_background(self._selection_mode_worker, mode, previous_mode)
+    
+    def _selection_mode_worker(self, mode, previous_mode):
+        """
+        选择模式切换工作线程
+        
+        Args:
+            mode: 新的选择模式
+            previous_mode: 切换前的选择模式（失败时恢复）
+        """
+        try:
             self.symbol_selector.set_selection_mode(mode)
-            self.selected_symbols = self.symbol_selector.get_selected_symbols()
-            self.update_selected_count()
-            self.refresh_symbols()
+            selected = self.symbol_selector.get_selected_symbols()
+        except Exception as e:
+            self._post_to_ui(self.on_selection_mode_failed, previous_mode, str(e))
+        else:
+            self._post_to_ui(self.on_selection_mode_applied, mode, selected)
+    
+    def on_selection_mode_failed(self, previous_mode, message):
+        """
+        选择模式切换失败（主线程），恢复下拉框和当前模式以便重新选择
+        
+        Args:
+            previous_mode: 切换前的选择模式
+            message: 错误信息
+        """
+        self.log(f"切换选择模式失败: {message}")
+        self._current_mode = previous_mode
+        if self._selection_mode_job is None:  # 用户正在重新选择时不覆盖下拉框
+            self.selection_mode_var.set(_SELECTION_MODE_LABELS[previous_mode])
+    
+    def on_selection_mode_applied(self, mode, selected):
+        """
+        选择模式切换完成（主线程）
+        
+        Args:
+            mode: 已生效的选择模式
+            selected: 新模式下选中的合约列表
+        """
+        # 之前排队的切换失败时会恢复旧模式，以最后生效的模式为准
+        self._current_mode = mode
+        if self._selection_mode_job is None:  # 用户正在重新选择时不覆盖下拉框
+            self.selection_mode_var.set(_SELECTION_MODE_LABELS[mode])
+        self.selected_symbols = selected
+        self._selected_symbol_set = set(selected)
+        self.update_selected_count()
+        # 合约数据未变，无需重新请求；切换到评分模式时评分会重新计算，需重新格式化
+        self._format_symbol_data()
+        self._rebuild_symbol_rows(keep_position=True)
     
     def on_symbol_double_click(self, event):
         """双击合约"""
@@ -728,20 +1474,34 @@ class FVGLiquidityGUI:
         if not selection:
             return
         
-        item = self.symbol_tree.item(selection[0])
-        symbol = item['values'][0]
+        # 表格只显示_symbol_view_rows中的一段，按行号直接取合约名，无需读取整行values
+        index = self._symbol_view_start + self.symbol_tree.index(selection[0])
+        symbol = self._symbol_view_rows[index][0]
         
-        if symbol in self.selected_symbols:
+        if symbol in self._selected_symbol_set:
+            self._selected_symbol_set.discard(symbol)
             self.selected_symbols.remove(symbol)
         else:
+            self._selected_symbol_set.add(symbol)
             self.selected_symbols.append(symbol)
         
+        self._schedule_selection_render()
+    
+    def _schedule_selection_render(self):
+        """安排一次选中状态的重绘（同一轮事件中多次改动只重绘一次）"""
+        if not self._selection_render_scheduled:
+            self._selection_render_scheduled = True
+            self.root.after_idle(self._render_selection)
+    
+    def _render_selection(self):
+        """更新已选数量并用当前选中状态重建表格行"""
+        self._selection_render_scheduled = False
         self.update_selected_count()
-        self.refresh_symbols()
+        self._rebuild_symbol_rows(keep_position=True)
     
     def update_selected_count(self):
         """更新已选数量"""
-        self.selected_count_label.config(text=f"已选: {len(self.selected_symbols)}")
+        self._configure_if_changed(self.selected_count_label, text=f"已选: {len(self.selected_symbols)}")
         
         if self.strategy_system:
             self.strategy_system.update_selected_symbols(self.selected_symbols)
@@ -771,12 +1531,13 @@ class FVGLiquidityGUI:
             self.strategy_system.start()
             
             # 更新UI
-            self.start_btn.config(text="⏹️ 停止策略", bg="#F44336")
-            self.system_status_label.config(text="状态: 运行中", fg="#4CAF50")
+            self._configure_if_changed(self.start_btn, text="⏹️ 停止策略", bg="#F44336")
+            self._configure_if_changed(self.system_status_label, text="状态: 运行中", fg="#4CAF50")
             
             # 启动UI更新
             self.auto_update_running = True
-            threading.Thread(target=self.auto_update_loop, daemon=True).start()
+            if self._auto_update_job is None:
+                self.auto_update_loop()
             
             self.log("策略已启动")
             
@@ -790,8 +1551,11 @@ class FVGLiquidityGUI:
             self.strategy_system.stop()
         
         self.auto_update_running = False
-        self.start_btn.config(text="▶️ 启动策略", bg="#4CAF50")
-        self.system_status_label.config(text="状态: 已停止", fg="#666666")
+        if self._auto_update_job is not None:
+            self.root.after_cancel(self._auto_update_job)
+            self._auto_update_job = None
+        self._configure_if_changed(self.start_btn, text="▶️ 启动策略", bg="#4CAF50")
+        self._configure_if_changed(self.system_status_label, text="状态: 已停止", fg="#666666")
         
         self.log("策略已停止")
     
@@ -799,85 +1563,120 @@ class FVGLiquidityGUI:
         """暂停策略"""
         if self.strategy_system:
             self.strategy_system.pause()
-        self.system_status_label.config(text="状态: 已暂停", fg="#FF9800")
+        self._configure_if_changed(self.system_status_label, text="状态: 已暂停", fg="#FF9800")
         self.log("策略已暂停")
     
     def resume_strategy(self):
         """恢复策略"""
         if self.strategy_system:
             self.strategy_system.resume()
-        self.system_status_label.config(text="状态: 运行中", fg="#4CAF50")
+        self._configure_if_changed(self.system_status_label, text="状态: 运行中", fg="#4CAF50")
         self.log("策略已恢复")
     
     def auto_update_loop(self):
-        """自动更新循环"""
-        while self.auto_update_running:
-            try:
-                # 使用after确保在主线程更新UI
-                self.root.after(0, self.update_stats)
-                self.root.after(0, self.update_positions)
-                self.root.after(0, self.update_signals)
-                
-                time.sleep(2)
-            except Exception as e:
-                self.log(f"更新失败: {e}")
+        """
+        自动更新循环
+        
+        在主线程中通过after定时调度，每个周期只刷新当前显示的标签页；
+        上一次刷新完成后才安排下一次，界面繁忙时不会堆积回调
+        """
+        self._auto_update_job = None
+        if not self.auto_update_running:
+            return
+        
+        try:
+            # 隐藏的标签页不刷新（持仓还需网络请求），切换到该页时再立即刷新
+            refresh = self._tab_refreshers.get(self.notebook.select())
+            if refresh is not None:
+                refresh()
+        except Exception as e:
+            self.log(f"更新失败: {e}")
+        
+        self._auto_update_job = self.root.after(self.ui_update_interval_ms, self.auto_update_loop)
     
     def update_stats(self):
         """更新统计信息"""
         if self.strategy_system:
             stats = self.strategy_system.stats
-            self.stats_labels['total_loops'].config(text=str(stats['total_loops']))
-            self.stats_labels['confluences'].config(text=str(stats['confluences_found']))
-            self.stats_labels['trades'].config(text=str(stats['trades_executed']))
-            self.stats_labels['symbols'].config(text=str(len(self.selected_symbols)))
-            self.stats_labels['timeframes'].config(text=str(stats['timeframes_analyzed']))
+            for label, stats_key, formatter in self._stats_bindings:
+                value = stats[stats_key] if stats_key else len(self.selected_symbols)
+                self._configure_if_changed(label, text=formatter(value))
+    
+    def _configure_if_changed(self, widget, **options):
+        """
+        只把与上次不同的选项提交给组件，避免重复的Tk配置和重绘
+        
+        Args:
+            widget: Tk组件
+            **options: 组件选项（如text、fg、bg）
+        """
+        last = self._widget_state.setdefault(str(widget), {})
+        changed = {key: value for key, value in options.items() if last.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            last.update(changed)
     
     def update_positions(self):
-        """更新持仓"""
-        if self.trading_client:
-            try:
-                positions = self.trading_client.get_positions()
-                
-                # 清空表格
-                for item in self.positions_tree.get_children():
-                    self.positions_tree.delete(item)
-                
-                # 添加持仓
-                for pos in positions:
-                    pnl_percent = (pos['unRealizedProfit'] / pos['notional']) * 100 if pos['notional'] != 0 else 0
-                    pnl_color = "#4CAF50" if pos['unRealizedProfit'] >= 0 else "#F44336"
-                    
-                    self.positions_tree.insert("", tk.END, values=(
-                        pos['symbol'],
-                        pos['positionSide'],
-                        f"{pos['positionAmt']:.4f}",
-                        f"{pos['entryPrice']:.2f}",
-                        f"{pos['markPrice']:.2f}",
-                        f"{pos['unRealizedProfit']:.2f}",
-                        f"{pnl_percent:.2f}%",
-                        f"{pos['stopLossPrice']:.2f}" if pos['stopLossPrice'] else "-",
-                        f"{pos['takeProfitPrice']:.2f}" if pos['takeProfitPrice'] else "-"
-                    ))
+        """更新持仓（查询在后台执行，上一次查询未完成时不重复提交）"""
+        if self.trading_client is None or self.positions_tree is None or self._positions_fetch_pending:
+            return
+        self._positions_fetch_pending = True
+        self._run_in_background(self._fetch_positions_worker, self.trading_client)
+    
+    def _fetch_positions_worker(self, trading_client):
+        """持仓查询工作线程（在后台完成请求和格式化，结果交给主线程显示）"""
+        try:
+            positions = trading_client.get_positions()
+            
+            # 先准备好全部行，再一次性替换表格内容
+            rows = []
+            for pos in positions:
+                pnl_percent = (pos['unRealizedProfit'] / pos['notional']) * 100 if pos['notional'] != 0 else 0
                 
-            except Exception as e:
-                pass
+                rows.append((
+                    pos['symbol'],
+                    pos['positionSide'],
+                    f"{pos['positionAmt']:.4f}",
+                    f"{pos['entryPrice']:.2f}",
+                    f"{pos['markPrice']:.2f}",
+                    f"{pos['unRealizedProfit']:.2f}",
+                    f"{pnl_percent:.2f}%",
+                    f"{pos['stopLossPrice']:.2f}" if pos['stopLossPrice'] else "-",
+                    f"{pos['takeProfitPrice']:.2f}" if pos['takeProfitPrice'] else "-"
+                ))
+        except Exception:
+            rows = None
+        self._post_to_ui(self._show_positions, rows)
+    
+    def _show_positions(self, rows):
+        """
+        显示持仓查询结果（主线程）
+        
+        Args:
+            rows: 持仓行数据（None表示查询失败，保留原表格内容）
+        """
+        self._positions_fetch_pending = False
+        if rows is not None:
+            self._replace_tree_rows(self.positions_tree, rows, self.positions_scrollbar)
     
     def update_signals(self):
-        """更新信号显示"""
-        if self.strategy_system:
+        """更新信号显示（按合约增量更新表格行）"""
+        if self.strategy_system and self.signals_tree is not None:
             try:
                 # 获取所有共振信号
                 confluences = self.strategy_system.symbol_confluences
                 
-                # 清空表格
-                for item in self.signals_tree.get_children():
-                    self.signals_tree.delete(item)
-                
-                # 添加信号
+                rows = {}
                 for symbol, confluence in confluences.items():
+                    # 每轮分析都会生成新的共振对象，对象未变时无需重新格式化
+                    row = self._signal_rows.get(symbol)
+                    if row is not None and row[2] is confluence:
+                        rows[symbol] = row[1]
+                        continue
+                    
                     if confluence and confluence.primary_signal:
                         signal = confluence.primary_signal
-                        time_str = datetime.now().strftime("%H:%M:%S")
+                        time_str = confluence.analysis_time.strftime("%H:%M:%S")
                         
                         # 计算盈亏比
                         if signal.entry_price > 0:
@@ -895,7 +1694,7 @@ class FVGLiquidityGUI:
                         else:
                             rr_ratio = 0
                         
-                        self.signals_tree.insert("", tk.END, values=(
+                        rows[symbol] = (
                             time_str,
                             symbol,
                             confluence.confluence_type,
@@ -905,7 +1704,38 @@ class FVGLiquidityGUI:
                             f"{signal.take_profit:.6f}",
                             f"{confluence.confidence:.1%}",
                             f"{rr_ratio:.2f}"
-                        ))
+                        )
+                
+                # 删除已消失的信号
+                stale = [symbol for symbol in self._signal_rows if symbol not in rows]
+                added = [symbol for symbol in rows if symbol not in self._signal_rows]
+                hidden = len(added) >= self.bulk_insert_threshold
+                if hidden:
+                    self.signals_tree.grid_remove()
+                if stale or added:
+                    self._suspend_yscroll(self.signals_tree)
+                if stale:
+                    self.signals_tree.delete(*(self._signal_rows.pop(symbol)[0] for symbol in stale))
+                
+                # 只更新内容有变化的行，新信号追加到末尾
+                insert = self.signals_tree.insert
+                item = self.signals_tree.item
+                signal_rows = self._signal_rows
+                for symbol, values in rows.items():
+                    confluence = confluences[symbol]
+                    row = signal_rows.get(symbol)
+                    if row is None:
+                        iid = insert("", tk.END, values=values)
+                        signal_rows[symbol] = (iid, values, confluence)
+                    elif row[2] is not confluence:
+                        if row[1] != values:
+                            item(row[0], values=values)
+                        signal_rows[symbol] = (row[0], values, confluence)
+                
+                if stale or added:
+                    self._resume_yscroll(self.signals_tree, self.signals_scrollbar)
+                if hidden:
+                    self.signals_tree.grid()
                 
             except Exception as e:
                 self.log(f"更新信号失败: {e}")
@@ -913,34 +1743,21 @@ class FVGLiquidityGUI:
     def save_parameters(self):
         """保存参数"""
         try:
-            # 收集FVG参数
-            fvg_config = {}
-            for key, entry in self.fvg_params.items():
-                value = entry.get()
-                fvg_config[key] = value
-            
-            # 收集流动性参数
-            liquidity_config = {}
-            for key, entry in self.liquidity_params.items():
-                value = entry.get()
-                liquidity_config[key] = value
-            
-            # 收集风险参数
-            risk_config = {}
-            for key, entry in self.risk_params.items():
-                value = entry.get()
-                risk_config[key] = value
+            # 按创建输入框时确定的转换函数把文本转换为配置值
+            updates = {}
+            for section, params in (
+                ('fvg_strategy', self.fvg_params),
+                ('liquidity_analyzer', self.liquidity_params),
+                ('risk_manager', self.risk_params),
+            ):
+                updates[section] = {key: convert(entry.get()) for key, (entry, convert) in params.items()}
             
             # 更新配置
-            update_config({
-                'fvg_strategy': fvg_config,
-                'liquidity_analyzer': liquidity_config,
-                'risk_manager': risk_config
-            })
+            update_config(updates)
             
             self.apply_parameters()
             
-            messagebox.showinfo("成功", "参数已保存并应用")
+            self.show_status("参数已保存并应用")
             self.log("参数已更新")
             
         except Exception as e:
@@ -978,7 +1795,7 @@ class FVGLiquidityGUI:
                 raise Exception(result.get('msg'))
             
             self.log(f"已开仓: {side} {size} {symbol}")
-            messagebox.showinfo("成功", f"已开仓: {side} {size} {symbol}")
+            self.show_status(f"已开仓: {side} {size} {symbol}")
             
         except Exception as e:
             messagebox.showerror("错误", f"开仓失败: {e}")
@@ -1022,17 +1839,59 @@ class FVGLiquidityGUI:
                 raise Exception(result.get('msg'))
             
             self.log(f"已平仓: {size} {symbol}")
-            messagebox.showinfo("成功", f"已平仓: {size} {symbol}")
+            self.show_status(f"已平仓: {size} {symbol}")
             
         except Exception as e:
             messagebox.showerror("错误", f"平仓失败: {e}")
     
     def log(self, message):
-        """记录日志"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
+        """
+        记录日志（先进入队列，空闲时批量写入日志框）
+        
+        可在任意线程调用；后台线程通过结果队列让主线程刷新日志框
+        """
+        # 同一秒内的日志复用时间戳，避免每条都调用strftime
+        now = int(time.time())
+        stamp_sec, timestamp = self._log_stamp
+        if now != stamp_sec:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._log_stamp = (now, timestamp)
+        self._log_queue.append(f"[{timestamp}] {message}\n")
         print(message)
+        
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            if threading.get_ident() == self._ui_thread_id:
+                self.root.after_idle(self._flush_log)
+            else:
+                self._post_to_ui(self._flush_log)
+    
+    def _flush_log(self):
+        """将队列中的日志一次性写入日志框，并只保留最近max_log_lines行"""
+        self._log_flush_scheduled = False
+        
+        # 逐条取出（其他线程可能同时追加，不能直接遍历后clear）
+        lines = []
+        popleft = self._log_queue.popleft
+        try:
+            while True:
+                lines.append(popleft())
+        except IndexError:
+            pass
+        if not lines:
+            return
+        
+        text = "".join(lines)
+        self.log_text.insert(tk.END, text)
+        
+        # 行数在Python侧累计，无需每次向Tk查询；超出上限时一次多删一批
+        self._log_line_count += text.count("\n")
+        if self._log_line_count > self.max_log_lines:
+            remove = self._log_line_count - self.max_log_lines + self.log_trim_batch
+            self.log_text.delete("1.0", f"{remove + 1}.0")
+            self._log_line_count -= remove
+        
+        self.log_text.see(tk.END)
 
 
 if __name__ == "__main__":
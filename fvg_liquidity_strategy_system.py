@@ -7,6 +7,7 @@ FVG流动性策略系统 - 完整系统
 
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, List, Dict, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
@@ -29,6 +30,25 @@ from parameter_config import get_config
 
 logger = logging.getLogger(__name__)
 
+# 日志中最多列出的标的数量
+MAX_LOGGED_SYMBOLS = 20
+
+
+def _summarize_symbols(symbols: List[str]) -> str:
+    """
+    生成标的列表的日志摘要（只列出前MAX_LOGGED_SYMBOLS个）
+    
+    Args:
+        symbols: 标的列表
+        
+    Returns:
+        摘要字符串
+    """
+    summary = ', '.join(symbols[:MAX_LOGGED_SYMBOLS])
+    if len(symbols) > MAX_LOGGED_SYMBOLS:
+        summary += f" 等{len(symbols)}个"
+    return summary
+
 
 class SystemState(Enum):
     """系统状态"""
@@ -88,6 +108,11 @@ class FVGLiquidityStrategySystem:
         self.symbol_analyses: Dict[str, Dict[str, TimeframeAnalysis]] = {}
         self.symbol_confluences: Dict[str, MultiTimeframeConfluence] = {}
         
+        # K线并发获取线程池（请求耗时主要是网络往返，串行时随标的数量线性增长）
+        # 在start()中创建、stop()中关闭，避免每次登录新建的系统遗留线程
+        self.kline_fetch_workers = 8
+        self._kline_executor: Optional[ThreadPoolExecutor] = None
+        
         # 系统状态
         self.state = SystemState.INITIALIZING
         self.thread: Optional[threading.Thread] = None
@@ -124,11 +149,9 @@ class FVGLiquidityStrategySystem:
         try:
             # 初始化合约选择器
             self._log("正在获取USDT永续合约列表...")
-            self.symbol_selector.update_symbol_list(force_update=True)
+            self.symbol_selector.update_symbol_list()
             self.selected_symbols = self.symbol_selector.get_selected_symbols()
-            self._log(f"已选择 {len(self.selected_symbols)} 个合约进行监控")
-            for symbol in self.selected_symbols:
-                self._log(f"  - {symbol}")
+            self._log(f"已选择 {len(self.selected_symbols)} 个合约进行监控: {_summarize_symbols(self.selected_symbols)}")
             
             # 初始化风险管理器
             account_info = self.trading_client.get_account_info()
@@ -149,12 +172,13 @@ class FVGLiquidityStrategySystem:
     
     def update_selected_symbols(self, symbols: List[str]):
         """
-        更新选中的标的
+        更新选中的标的（整体替换为新列表，只记录一条日志）
         
         Args:
             symbols: 标的列表
         """
-        self.selected_symbols = symbols
+        # 复制一份，调用方之后修改自己的列表不会影响正在进行的分析
+        self.selected_symbols = list(symbols)
         self._log(f"已更新标的列表: {len(symbols)} 个合约")
     
     def set_selection_mode(self, mode: SelectionMode):
@@ -209,11 +233,13 @@ class FVGLiquidityStrategySystem:
         
         self.running = True
         self.state = SystemState.RUNNING
+        if self._kline_executor is None:
+            self._kline_executor = ThreadPoolExecutor(max_workers=self.kline_fetch_workers)
         self.thread = threading.Thread(target=self._main_loop, daemon=True)
         self.thread.start()
         
         self._log("FVG流动性策略系统已启动")
-        self._log(f"监控标的: {', '.join(self.selected_symbols)}")
+        self._log(f"监控标的: {_summarize_symbols(self.selected_symbols)}")
         self._log(f"分析周期: {', '.join(self.fvg_config.timeframes)}")
         self._log(f"主周期: {self.primary_timeframe}")
         self._log("开始主循环...")
@@ -225,6 +251,9 @@ class FVGLiquidityStrategySystem:
         self.state = SystemState.STOPPED
         if self.thread:
             self.thread.join(timeout=10)
+        if self._kline_executor is not None:
+            self._kline_executor.shutdown(wait=False)
+            self._kline_executor = None
         self._log("系统已停止")
     
     def pause(self):
@@ -368,7 +397,8 @@ class FVGLiquidityStrategySystem:
         # 批量分析市场状态
         state_infos = self.market_state_engine.analyze_batch(self.selected_symbols)
         
-        # 为每个标的分析多周期
+        # 筛选需要做多周期分析的标的
+        candidates = []
         for symbol in self.selected_symbols:
             state_info = state_infos.get(symbol)
             if not state_info:
@@ -392,15 +422,28 @@ class FVGLiquidityStrategySystem:
                 self.stats['skips']['not_worth'] += 1
                 continue
             
-            # 3. 获取各周期K线数据
+            candidates.append(symbol)
+        
+        # 3. 并发获取所有候选标的各周期K线数据
+        executor = self._kline_executor
+        if executor is None:
+            # 系统已停止（线程池已关闭）
+            return None
+        timeframes = self.fvg_config.timeframes
+        kline_limit = self.fvg_config.fvg_detection_lookback + 50
+        kline_futures = {
+            (symbol, tf): executor.submit(
+                self.data_fetcher.get_klines, symbol, tf, kline_limit
+            )
+            for symbol in candidates
+            for tf in timeframes
+        }
+        
+        for symbol in candidates:
             klines_data = {}
-            for tf in self.fvg_config.timeframes:
+            for tf in timeframes:
                 try:
-                    klines = self.data_fetcher.get_klines(
-                        symbol, 
-                        tf, 
-                        limit=self.fvg_config.fvg_detection_lookback + 50
-                    )
+                    klines = kline_futures[(symbol, tf)].result()
                     if klines and len(klines) > self.fvg_config.fvg_detection_lookback:
                         klines_data[tf] = klines
                         self.stats['timeframes_analyzed'] += 1
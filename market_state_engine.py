@@ -77,7 +77,7 @@ class MarketStateEngine:
         # 获取数据
         atr = self.data_fetcher.get_atr(self.symbol, self.interval, self.atr_period)
         volume_ma = self.data_fetcher.get_volume_ma(self.symbol, self.interval, self.volume_ma_period)
-        latest_volume = self.data_fetcher.get_klines(self.symbol, self.interval, limit=1)[0].volume
+        latest_volume = self.data_fetcher.get_klines(self.symbol, self.interval, limit=1)[-1].volume
         funding_rate = self.data_fetcher.get_funding_rate(self.symbol)
         current_price = self.data_fetcher.get_latest_price(self.symbol)
         
@@ -120,6 +120,27 @@ class LiquidityAnalyzerConfig:
     liquidity_weight: float = 0.4           # 流动性信号在总评分中的权重
 
 
+# 配置分区名称（与ParameterConfig字段顺序一致）
+CONFIG_SECTIONS = (
+    'fakeout_strategy',
+    'risk_manager',
+    'worth_trading_filter',
+    'execution_gate',
+    'system',
+    'market_state_engine',
+    'fvg_strategy',
+    'liquidity_analyzer',
+)
+
+# 需要类型校验的参数 {(分区, 参数名): 期望类型}
+_TYPED_FIELDS = {
+    ('fvg_strategy', 'timeframes'): list,
+    ('fvg_strategy', 'liquidity_timeframes'): list,
+    ('fvg_strategy', 'timeframe_weights'): dict,
+    ('liquidity_analyzer', 'liquidity_timeframes'): list,
+}
+
+
 @dataclass
 class ParameterConfig:
     """参数配置总类"""
@@ -134,56 +155,22 @@ class ParameterConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        return {
-            'fakeout_strategy': self.fakeout_strategy.__dict__,
-            'risk_manager': self.risk_manager.__dict__,
-            'worth_trading_filter': self.worth_trading_filter.__dict__,
-            'execution_gate': self.execution_gate.__dict__,
-            'system': self.system.__dict__,
-            'market_state_engine': self.market_state_engine.__dict__,
-            'fvg_strategy': self.fvg_strategy.__dict__,
-            'liquidity_analyzer': self.liquidity_analyzer.__dict__
-        }
+        return {name: getattr(self, name).__dict__ for name in CONFIG_SECTIONS}
     
     def from_dict(self, data: Dict[str, Any]):
         """从字典加载"""
-        if 'fakeout_strategy' in data:
-            for k, v in data['fakeout_strategy'].items():
-                setattr(self.fakeout_strategy, k, v)
-        if 'risk_manager' in data:
-            for k, v in data['risk_manager'].items():
-                setattr(self.risk_manager, k, v)
-        if 'worth_trading_filter' in data:
-            for k, v in data['worth_trading_filter'].items():
-                setattr(self.worth_trading_filter, k, v)
-        if 'execution_gate' in data:
-            for k, v in data['execution_gate'].items():
-                setattr(self.execution_gate, k, v)
-        if 'system' in data:
-            for k, v in data['system'].items():
-                setattr(self.system, k, v)
-        if 'market_state_engine' in data:
-            for k, v in data['market_state_engine'].items():
-                setattr(self.market_state_engine, k, v)
-        if 'fvg_strategy' in data:
-            for k, v in data['fvg_strategy'].items():
-                # 特殊处理列表和字典类型
-                if k == 'timeframes' or k == 'liquidity_timeframes':
-                    if isinstance(v, list):
-                        setattr(self.fvg_strategy, k, v)
-                elif k == 'timeframe_weights':
-                    if isinstance(v, dict):
-                        setattr(self.fvg_strategy, k, v)
-                else:
-                    setattr(self.fvg_strategy, k, v)
-        if 'liquidity_analyzer' in data:
-            for k, v in data['liquidity_analyzer'].items():
-                # 特殊处理列表类型
-                if k == 'liquidity_timeframes':
-                    if isinstance(v, list):
-                        setattr(self.liquidity_analyzer, k, v)
-                else:
-                    setattr(self.liquidity_analyzer, k, v)
+        for name in CONFIG_SECTIONS:
+            section_data = data.get(name)
+            if not section_data:
+                continue
+            
+            # 直接写入分区实例的__dict__，省去逐项setattr
+            section_dict = getattr(self, name).__dict__
+            for k, v in section_data.items():
+                # 列表和字典类型的参数只接受对应类型的值
+                expected_type = _TYPED_FIELDS.get((name, k))
+                if expected_type is None or isinstance(v, expected_type):
+                    section_dict[k] = v
 
 
 # 全局配置实例
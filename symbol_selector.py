@@ -5,7 +5,11 @@
 获取币安USDT永续合约列表，支持手动选择和自动筛选
 """
 
-from typing import List, Dict, Optional, Set
+import heapq
+import json
+import os
+import time
+from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -44,15 +48,21 @@ class SymbolInfo:
 class SymbolSelector:
     """合约选择器"""
     
-    def __init__(self, api_client: BinanceAPIClient):
+    def __init__(self, api_client: BinanceAPIClient, contract_cache_file: Optional[str] = "symbol_cache.json"):
         """
         初始化合约选择器
         
         Args:
             api_client: 币安API客户端
+            contract_cache_file: 合约列表磁盘缓存文件路径（None表示不使用磁盘缓存）
         """
         self.api_client = api_client
+        self.contract_cache_file = contract_cache_file
+        self.contract_cache_ttl_minutes = 60  # 合约列表很少变化，缓存1小时
+        self.market_snapshot_ttl_seconds = 60  # 24h统计和标记价格的内存缓存时间
+        self._market_snapshot: Optional[Tuple[float, Dict[str, Dict], Dict[str, Dict]]] = None
         self.all_symbols: List[SymbolInfo] = []
+        self._symbols_by_name: Dict[str, SymbolInfo] = {}  # 按标的代码索引all_symbols
         self.selected_symbols: Set[str] = set()
         self.selection_mode = SelectionMode.AUTO_SCORE
         self.last_update: Optional[datetime] = None
@@ -76,7 +86,7 @@ class SymbolSelector:
         更新合约列表
         
         Args:
-            force_update: 是否强制更新
+            force_update: 是否强制更新（同时跳过磁盘缓存，重新获取合约列表）
             
         Returns:
             合约列表
@@ -88,64 +98,14 @@ class SymbolSelector:
                 return self.all_symbols
         
         try:
-            # 获取所有USDT永续合约
-            exchange_info = self.api_client._make_request('/fapi/v1/exchangeInfo')
+            # 获取所有USDT永续合约（未强制更新时优先使用磁盘缓存）
+            usdt_perpetuals = None if force_update else self._load_contract_cache()
+            if usdt_perpetuals is None:
+                usdt_perpetuals = self._fetch_usdt_perpetuals()
+                self._save_contract_cache(usdt_perpetuals)
             
-            # 检查是否出错
-            if isinstance(exchange_info, dict) and exchange_info.get('error'):
-                raise Exception(f"获取合约信息失败: {exchange_info.get('message')}")
-            
-            # 检查是否是有效的数据
-            if not isinstance(exchange_info, dict) or 'symbols' not in exchange_info:
-                raise Exception("获取合约信息失败: 返回数据格式错误")
-            
-            # 筛选USDT永续合约
-            usdt_perpetuals = []
-            for symbol_info in exchange_info.get('symbols', []):
-                symbol = symbol_info.get('symbol')
-                contract_type = symbol_info.get('contractType')
-                quote_asset = symbol_info.get('quoteAsset')
-                status = symbol_info.get('status')
-                
-                # 筛选条件：USDT永续合约且在交易
-                if (contract_type == 'PERPETUAL' and 
-                    quote_asset == 'USDT' and 
-                    status == 'TRADING'):
-                    
-                    usdt_perpetuals.append({
-                        'symbol': symbol,
-                        'base_asset': symbol_info.get('baseAsset'),
-                        'quote_asset': quote_asset,
-                        'contract_type': contract_type,
-                        'status': status
-                    })
-            
-            # 获取24小时统计数据
-            ticker_24h = self.api_client._make_request('/fapi/v1/ticker/24hr')
-            
-            # 检查是否出错
-            if isinstance(ticker_24h, dict) and ticker_24h.get('error'):
-                raise Exception(f"获取24h统计失败: {ticker_24h.get('message')}")
-            
-            # 检查是否是有效的数据
-            if not isinstance(ticker_24h, list):
-                raise Exception("获取24h统计失败: 返回数据格式错误")
-            
-            # 构建24h统计字典
-            ticker_dict = {t['symbol']: t for t in ticker_24h}
-            
-            # 获取标记价格和资金费率
-            premium_index = self.api_client._make_request('/fapi/v1/premiumIndex')
-            
-            # 检查是否出错
-            if isinstance(premium_index, dict) and premium_index.get('error'):
-                raise Exception(f"获取标记价格失败: {premium_index.get('message')}")
-            
-            # 检查是否是有效的数据
-            if not isinstance(premium_index, list):
-                raise Exception("获取标记价格失败: 返回数据格式错误")
-            
-            premium_dict = {p['symbol']: p for p in premium_index}
+            # 获取24小时统计、标记价格和资金费率（短时间内重复刷新时复用）
+            ticker_dict, premium_dict = self._get_market_snapshot()
             
             # 构建SymbolInfo列表
             symbols = []
@@ -185,6 +145,7 @@ class SymbolSelector:
                 symbols.append(symbol_info)
             
             self.all_symbols = symbols
+            self._symbols_by_name = {symbol_info.symbol: symbol_info for symbol_info in symbols}
             self.last_update = datetime.now()
             
             # 更新选中的标的
@@ -197,6 +158,131 @@ class SymbolSelector:
             print(f"更新合约列表失败: {str(e)}")
             return self.all_symbols
     
+    def _get_market_snapshot(self) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """
+        获取全市场24h统计和标记价格
+        
+        每项数据都是一次不带symbol参数的请求返回全部合约，
+        结果在内存中缓存market_snapshot_ttl_seconds秒
+        
+        Returns:
+            (24h统计字典, 标记价格字典)，均以symbol为键
+        """
+        if self._market_snapshot is not None:
+            fetched_at, ticker_dict, premium_dict = self._market_snapshot
+            if time.monotonic() - fetched_at < self.market_snapshot_ttl_seconds:
+                return ticker_dict, premium_dict
+        
+        # 获取24小时统计数据
+        ticker_24h = self.api_client._make_request('/fapi/v1/ticker/24hr')
+        
+        # 检查是否出错
+        if isinstance(ticker_24h, dict) and ticker_24h.get('error'):
+            raise Exception(f"获取24h统计失败: {ticker_24h.get('message')}")
+        
+        # 检查是否是有效的数据
+        if not isinstance(ticker_24h, list):
+            raise Exception("获取24h统计失败: 返回数据格式错误")
+        
+        # 构建24h统计字典
+        ticker_dict = {t['symbol']: t for t in ticker_24h}
+        
+        # 获取标记价格和资金费率
+        premium_index = self.api_client._make_request('/fapi/v1/premiumIndex')
+        
+        # 检查是否出错
+        if isinstance(premium_index, dict) and premium_index.get('error'):
+            raise Exception(f"获取标记价格失败: {premium_index.get('message')}")
+        
+        # 检查是否是有效的数据
+        if not isinstance(premium_index, list):
+            raise Exception("获取标记价格失败: 返回数据格式错误")
+        
+        premium_dict = {p['symbol']: p for p in premium_index}
+        
+        self._market_snapshot = (time.monotonic(), ticker_dict, premium_dict)
+        return ticker_dict, premium_dict
+    
+    def _fetch_usdt_perpetuals(self) -> List[Dict]:
+        """
+        从exchangeInfo获取在交易的USDT永续合约
+        
+        Returns:
+            合约基本信息列表
+        """
+        exchange_info = self.api_client._make_request('/fapi/v1/exchangeInfo')
+        
+        # 检查是否出错
+        if isinstance(exchange_info, dict) and exchange_info.get('error'):
+            raise Exception(f"获取合约信息失败: {exchange_info.get('message')}")
+        
+        # 检查是否是有效的数据
+        if not isinstance(exchange_info, dict) or 'symbols' not in exchange_info:
+            raise Exception("获取合约信息失败: 返回数据格式错误")
+        
+        # 筛选USDT永续合约
+        usdt_perpetuals = []
+        for symbol_info in exchange_info.get('symbols', []):
+            symbol = symbol_info.get('symbol')
+            contract_type = symbol_info.get('contractType')
+            quote_asset = symbol_info.get('quoteAsset')
+            status = symbol_info.get('status')
+            
+            # 筛选条件：USDT永续合约且在交易
+            if (contract_type == 'PERPETUAL' and 
+                quote_asset == 'USDT' and 
+                status == 'TRADING'):
+                
+                usdt_perpetuals.append({
+                    'symbol': symbol,
+                    'base_asset': symbol_info.get('baseAsset'),
+                    'quote_asset': quote_asset,
+                    'contract_type': contract_type,
+                    'status': status
+                })
+        
+        return usdt_perpetuals
+    
+    def _load_contract_cache(self) -> Optional[List[Dict]]:
+        """
+        读取合约列表磁盘缓存
+        
+        Returns:
+            合约基本信息列表，缓存不存在或已过期时返回None
+        """
+        if not self.contract_cache_file or not os.path.exists(self.contract_cache_file):
+            return None
+        
+        try:
+            age_seconds = time.time() - os.path.getmtime(self.contract_cache_file)
+            if age_seconds >= self.contract_cache_ttl_minutes * 60:
+                return None
+            
+            with open(self.contract_cache_file, 'r') as f:
+                cache = json.load(f)
+            contracts = cache.get('contracts')
+            return contracts if isinstance(contracts, list) and contracts else None
+        except (OSError, ValueError):
+            return None
+    
+    def _save_contract_cache(self, contracts: List[Dict]):
+        """
+        写入合约列表磁盘缓存（先写临时文件再替换，避免读到半个文件）
+        
+        Args:
+            contracts: 合约基本信息列表
+        """
+        if not self.contract_cache_file or not contracts:
+            return
+        
+        tmp_file = f"{self.contract_cache_file}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({'timestamp': time.time(), 'contracts': contracts}, f)
+            os.replace(tmp_file, self.contract_cache_file)
+        except OSError as e:
+            print(f"写入合约缓存失败: {str(e)}")
+    
     def _apply_auto_selection(self):
         """应用自动选择"""
         if not self.all_symbols:
@@ -204,31 +290,31 @@ class SymbolSelector:
             return
         
         if self.selection_mode == SelectionMode.AUTO_VOLUME:
-            # 按成交量排序
-            sorted_symbols = sorted(self.all_symbols, key=lambda x: x.volume_24h, reverse=True)
-            self.selected_symbols = {s.symbol for s in sorted_symbols[:self.top_n_symbols]}
+            # 按成交量取前N个（只需前N名，不对全部合约排序）
+            top_symbols = heapq.nlargest(self.top_n_symbols, self.all_symbols, key=lambda x: x.volume_24h)
+            self.selected_symbols = {s.symbol for s in top_symbols}
             
-            # 添加原因
-            for s in sorted_symbols[:self.top_n_symbols]:
-                s.reasons = [f"成交量排名: {sorted_symbols.index(s) + 1}"]
+            # 添加原因（排名即切片中的位置，无需再在列表中查找）
+            for rank, s in enumerate(top_symbols, 1):
+                s.reasons = [f"成交量排名: {rank}"]
         
         elif self.selection_mode == SelectionMode.AUTO_VOLATILITY:
-            # 按波动率排序（这里用24h涨跌幅代替）
-            sorted_symbols = sorted(self.all_symbols, key=lambda x: abs(x.change_24h), reverse=True)
-            self.selected_symbols = {s.symbol for s in sorted_symbols[:self.top_n_symbols]}
+            # 按波动率取前N个（这里用24h涨跌幅代替）
+            top_symbols = heapq.nlargest(self.top_n_symbols, self.all_symbols, key=lambda x: abs(x.change_24h))
+            self.selected_symbols = {s.symbol for s in top_symbols}
             
-            for s in sorted_symbols[:self.top_n_symbols]:
+            for s in top_symbols:
                 s.reasons = [f"波动率: {abs(s.change_24h):.2f}%"]
         
         elif self.selection_mode == SelectionMode.AUTO_SCORE:
-            # 按综合评分排序
+            # 按综合评分取前N个
             for s in self.all_symbols:
                 s.score = self._calculate_score(s)
             
-            sorted_symbols = sorted(self.all_symbols, key=lambda x: x.score, reverse=True)
-            self.selected_symbols = {s.symbol for s in sorted_symbols[:self.top_n_symbols]}
+            top_symbols = heapq.nlargest(self.top_n_symbols, self.all_symbols, key=lambda x: x.score)
+            self.selected_symbols = {s.symbol for s in top_symbols}
             
-            for s in sorted_symbols[:self.top_n_symbols]:
+            for s in top_symbols:
                 s.reasons = [f"评分: {s.score:.1f}"]
     
     def _calculate_score(self, symbol_info: SymbolInfo) -> float:
@@ -350,10 +436,7 @@ class SymbolSelector:
         Returns:
             标的信息
         """
-        for sym_info in self.all_symbols:
-            if sym_info.symbol == symbol:
-                return sym_info
-        return None
+        return self._symbols_by_name.get(symbol)
     
     def get_top_symbols(self, n: int = 10) -> List[SymbolInfo]:
         """
@@ -365,8 +448,7 @@ class SymbolSelector:
         Returns:
             标的列表
         """
-        sorted_symbols = sorted(self.all_symbols, key=lambda x: x.score, reverse=True)
-        return sorted_symbols[:n]
+        return heapq.nlargest(n, self.all_symbols, key=lambda x: x.score)
     
     def get_all_symbols(self) -> List[SymbolInfo]:
         """
@@ -6,6 +6,8 @@ FVG流动性策略系统 - 综合测试脚本
 """
 
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 import logging
 
@@ -329,6 +331,406 @@ def test_multi_timeframe_analyzer():
         print(f"  ✓ 未检测到周期共振（正常现象）")
 
 
+class FakeKlineClient:
+    """模拟币安K线接口（不访问网络），记录每次请求的参数"""
+    
+    INTERVAL_MS = 60000
+    
+    def __init__(self, available: int):
+        self.available = available  # 交易所当前已有的K线数量
+        self.calls = []
+    
+    def _row(self, i: int) -> list:
+        open_time = i * self.INTERVAL_MS
+        price = str(100 + i)
+        return [open_time, price, price, price, price, "1", open_time + self.INTERVAL_MS - 1]
+    
+    def _make_request(self, endpoint, params=None):
+        self.calls.append(dict(params))
+        limit = params['limit']
+        start_time = params.get('startTime')
+        if start_time is None:
+            first = max(0, self.available - limit)
+        else:
+            first = start_time // self.INTERVAL_MS
+        return [self._row(i) for i in range(first, min(first + limit, self.available))]
+
+
+def test_merge_klines():
+    """测试增量K线拼接"""
+    from data_fetcher import DataFetcher, MarketData
+    
+    def kline(i, close=0.0):
+        return MarketData("ETHUSDT", "1m", open_time=i, close=close)
+    
+    stale = [kline(i) for i in range(5)]
+    
+    print("1. 测试重叠K线以新数据为准并保持长度...")
+    merged = DataFetcher._merge_klines(stale, [kline(4, close=1.0), kline(5), kline(6)])
+    assert [k.open_time for k in merged] == [2, 3, 4, 5, 6], "拼接结果错误"
+    assert merged[2].close == 1.0, "重叠K线未被更新"
+    print("  ✓ 拼接正确")
+    
+    print("2. 测试空增量...")
+    assert DataFetcher._merge_klines(stale, []) is stale, "空增量应返回原列表"
+    print("  ✓ 空增量返回原数据")
+
+
+def test_kline_incremental_refresh():
+    """测试K线缓存过期后的增量刷新"""
+    from data_fetcher import DataFetcher
+    
+    client = FakeKlineClient(available=300)
+    fetcher = DataFetcher(client)
+    
+    print("1. 首次获取...")
+    klines = fetcher.get_klines("ETHUSDT", "1m", limit=200)
+    assert len(klines) == 200 and len(client.calls) == 1, "首次获取应请求一次"
+    
+    print("2. 缓存过期后limit=1的增量刷新...")
+    client.available = 302
+    fetcher.cache_ttl_seconds = 0
+    latest = fetcher.get_klines("ETHUSDT", "1m", limit=1)
+    assert len(client.calls) == 2, f"增量刷新应只请求一次，实际{len(client.calls) - 1}次"
+    assert client.calls[-1]['limit'] == fetcher.incremental_kline_limit, "增量请求不应使用调用方的limit"
+    assert [k.open_time for k in latest] == [301 * FakeKlineClient.INTERVAL_MS], "未返回最新K线"
+    
+    cached = fetcher.cache["klines_ETHUSDT_1m"]
+    assert len(cached) == 200, "较短的请求不应缩短缓存"
+    assert cached[-1].open_time == 301 * FakeKlineClient.INTERVAL_MS, "缓存未拼接增量数据"
+    print("  ✓ 增量刷新一次请求，缓存长度不变")
+    
+    print("3. 缓存未过期时更长的请求直接使用缓存...")
+    fetcher.cache_ttl_seconds = 10
+    assert len(fetcher.get_klines("ETHUSDT", "1m", limit=150)) == 150, "应返回缓存的最近150根"
+    assert len(client.calls) == 2, "缓存足够时不应请求"
+    print("  ✓ 命中缓存")
+
+
+def test_kline_incremental_fallback():
+    """测试增量数据无法衔接时的全量回退"""
+    from data_fetcher import DataFetcher
+    
+    client = FakeKlineClient(available=300)
+    fetcher = DataFetcher(client)
+    fetcher.get_klines("ETHUSDT", "1m", limit=200)
+    fetcher.cache_ttl_seconds = 0
+    
+    print("1. 间隔超过一页时全量获取...")
+    client.available = 300 + fetcher.incremental_kline_limit * 2
+    klines = fetcher.get_klines("ETHUSDT", "1m", limit=1)
+    assert len(client.calls) == 3, "整页增量后应回退为一次全量请求"
+    assert client.calls[-1]['limit'] == 200 and 'startTime' not in client.calls[-1], "全量请求应按缓存长度获取"
+    assert klines[-1].open_time == (client.available - 1) * FakeKlineClient.INTERVAL_MS, "未返回最新K线"
+    assert len(fetcher.cache["klines_ETHUSDT_1m"]) == 200, "全量回退后缓存长度错误"
+    print("  ✓ 全量回退正确")
+    
+    print("2. 增量数据不衔接时全量获取...")
+    client.available = 0
+    calls_before = len(client.calls)
+    fetcher.get_klines("ETHUSDT", "1m", limit=1)
+    assert len(client.calls) == calls_before + 2, "不衔接时应在增量请求后全量获取"
+    assert len(fetcher.cache["klines_ETHUSDT_1m"]) == 200, "较短的结果不应覆盖缓存"
+    print("  ✓ 不衔接时回退全量获取")
+
+
+class GatedKlineClient(FakeKlineClient):
+    """第一次请求阻塞到gate打开为止，可指定返回的错误状态码"""
+    
+    def __init__(self, available: int, status_code: int = None):
+        super().__init__(available)
+        self.status_code = status_code
+        self.gate = threading.Event()
+        self.lock = threading.Lock()
+    
+    def _make_request(self, endpoint, params=None):
+        self.gate.wait(timeout=5)
+        with self.lock:
+            result = super()._make_request(endpoint, params)
+        if self.status_code is not None:
+            return {'error': True, 'status_code': self.status_code, 'message': 'mock error'}
+        return result
+
+
+class _LeaderExit(BaseException):
+    """模拟发起线程中的非Exception异常（如SystemExit）"""
+
+
+class ExitingKlineClient(GatedKlineClient):
+    """第一次请求抛出_LeaderExit，之后正常返回"""
+    
+    def _make_request(self, endpoint, params=None):
+        result = super()._make_request(endpoint, params)
+        with self.lock:
+            first = len(self.calls) == 1
+        if first:
+            raise _LeaderExit()
+        return result
+
+
+def _run_concurrent_get_klines(client, fetcher, callers=8):
+    """多个线程同时获取同一K线，返回各线程的结果或异常"""
+    outcomes = []
+    
+    def worker():
+        try:
+            outcomes.append(fetcher.get_klines("ETHUSDT", "1m", limit=200))
+        except BaseException as e:
+            outcomes.append(e)
+    
+    threads = [threading.Thread(target=worker) for _ in range(callers)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)  # 等待所有线程进入请求或等待状态
+    client.gate.set()
+    for t in threads:
+        t.join(timeout=5)
+    return outcomes
+
+
+def test_kline_single_flight():
+    """测试并发的相同K线请求只发起一次"""
+    from data_fetcher import DataFetcher
+    
+    print("1. 并发成功请求...")
+    client = GatedKlineClient(available=300)
+    fetcher = DataFetcher(client)
+    outcomes = _run_concurrent_get_klines(client, fetcher)
+    assert len(client.calls) == 1, f"应只请求一次，实际{len(client.calls)}次"
+    assert len(outcomes) == 8 and all(len(k) == 200 for k in outcomes), "等待的线程未取得结果"
+    print("  ✓ 8个线程共用一次请求")
+    
+    print("2. 并发失败请求...")
+    client = GatedKlineClient(available=300, status_code=500)
+    fetcher = DataFetcher(client)
+    fetcher.retry_base_delay = 0.001
+    outcomes = _run_concurrent_get_klines(client, fetcher)
+    assert len(client.calls) == 3, f"只应由发起线程重试3次，实际请求{len(client.calls)}次"
+    assert len(outcomes) == 8 and all(isinstance(e, Exception) for e in outcomes), "等待的线程应收到同一异常"
+    print("  ✓ 失败时等待的线程不再各自请求")
+    
+    print("3. 发起线程因非Exception异常退出...")
+    client = ExitingKlineClient(available=300)
+    fetcher = DataFetcher(client)
+    outcomes = _run_concurrent_get_klines(client, fetcher)
+    assert sum(isinstance(o, _LeaderExit) for o in outcomes) == 1, "只有发起线程应收到该异常"
+    klines = [o for o in outcomes if isinstance(o, list)]
+    assert len(klines) == 7 and all(len(k) == 200 for k in klines), "等待的线程应重新获取到结果"
+    assert len(client.calls) == 2, f"应由一个等待线程重新请求一次，实际请求{len(client.calls)}次"
+    print("  ✓ 等待的线程重新获取")
+
+
+class FakeMarketClient:
+    """模拟合约列表和行情接口，按端点统计请求次数"""
+    
+    def __init__(self, symbols):
+        self.symbols = list(symbols)
+        self.calls = {}
+    
+    def _make_request(self, endpoint, params=None):
+        self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+        if endpoint == '/fapi/v1/exchangeInfo':
+            return {'symbols': [
+                {'symbol': s, 'baseAsset': s[:-4], 'quoteAsset': 'USDT',
+                 'contractType': 'PERPETUAL', 'status': 'TRADING'}
+                for s in self.symbols
+            ]}
+        if endpoint == '/fapi/v1/ticker/24hr':
+            return [{'symbol': s, 'quoteVolume': '50000000', 'priceChangePercent': '1.5'} for s in self.symbols]
+        if endpoint == '/fapi/v1/premiumIndex':
+            return [{'symbol': s, 'markPrice': '10', 'lastFundingRate': '0.0001'} for s in self.symbols]
+        return {'error': True, 'message': 'unknown endpoint'}
+
+
+def test_contract_cache():
+    """测试合约列表磁盘缓存的命中、过期和强制刷新"""
+    import os
+    import tempfile
+    from symbol_selector import SymbolSelector
+    
+    exchange_info = '/fapi/v1/exchangeInfo'
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "symbol_cache.json")
+        
+        print("1. 首次获取并写入缓存...")
+        client = FakeMarketClient(["AAAUSDT", "BBBUSDT"])
+        SymbolSelector(client, contract_cache_file=cache_file).update_symbol_list()
+        assert client.calls[exchange_info] == 1 and os.path.exists(cache_file), "首次应请求并写入缓存"
+        
+        print("2. 缓存未过期时直接使用...")
+        client.symbols.append("CCCUSDT")
+        selector = SymbolSelector(client, contract_cache_file=cache_file)
+        names = [s.symbol for s in selector.update_symbol_list()]
+        assert client.calls[exchange_info] == 1, "缓存未过期时不应请求合约信息"
+        assert "CCCUSDT" not in names, "应使用缓存的合约列表"
+        print("  ✓ 命中缓存")
+        
+        print("3. 强制刷新跳过缓存...")
+        names = [s.symbol for s in selector.update_symbol_list(force_update=True)]
+        assert client.calls[exchange_info] == 2, "强制刷新应重新请求合约信息"
+        assert "CCCUSDT" in names, "强制刷新未取得新合约"
+        print("  ✓ 强制刷新取得新合约")
+        
+        print("4. 缓存过期后重新获取...")
+        client.symbols.remove("AAAUSDT")
+        expired = os.path.getmtime(cache_file) - selector.contract_cache_ttl_minutes * 60 - 1
+        os.utime(cache_file, (expired, expired))
+        names = [s.symbol for s in SymbolSelector(client, contract_cache_file=cache_file).update_symbol_list()]
+        assert client.calls[exchange_info] == 3, "缓存过期后应重新请求"
+        assert "AAAUSDT" not in names, "过期后应使用新的合约列表"
+        print("  ✓ 过期后重新获取")
+
+
+class FlakyKlineClient(FakeKlineClient):
+    """按顺序返回指定状态码的错误，状态码用完后正常返回K线"""
+    
+    def __init__(self, available: int, status_codes, retry_after: float = None):
+        super().__init__(available)
+        self.status_codes = list(status_codes)
+        self.retry_after = retry_after
+    
+    def _make_request(self, endpoint, params=None):
+        result = super()._make_request(endpoint, params)
+        if self.status_codes:
+            return {'error': True, 'status_code': self.status_codes.pop(0),
+                    'message': 'mock error', 'retry_after': self.retry_after}
+        return result
+
+
+def _record_backoff(fetcher):
+    """记录每次退避的参数并跳过实际等待，返回记录列表"""
+    delays = []
+    
+    def backoff(attempt, retry_after=None):
+        delays.append((attempt, retry_after))
+        return 0
+    
+    fetcher._backoff_delay = backoff
+    return delays
+
+
+def test_retry_backoff():
+    """测试请求重试次数和退避延迟"""
+    from data_fetcher import DataFetcher
+    from exceptions import APIError
+    
+    print("1. 服务端错误重试到上限...")
+    client = FlakyKlineClient(available=300, status_codes=[500] * 5)
+    fetcher = DataFetcher(client)
+    delays = _record_backoff(fetcher)
+    try:
+        fetcher.get_klines("ETHUSDT", "1m", limit=10)
+        assert False, "重试耗尽后应抛出异常"
+    except APIError as e:
+        assert e.status_code == 500, "异常状态码错误"
+    assert len(client.calls) == 3, f"应请求3次，实际{len(client.calls)}次"
+    assert [attempt for attempt, _ in delays] == [0, 1], "退避序号错误"
+    print("  ✓ 重试3次后放弃")
+    
+    print("2. 失败后重试成功...")
+    client = FlakyKlineClient(available=300, status_codes=[502, 503])
+    fetcher = DataFetcher(client)
+    _record_backoff(fetcher)
+    klines = fetcher.get_klines("ETHUSDT", "1m", limit=10)
+    assert len(client.calls) == 3 and len(klines) == 10, "重试成功后应返回K线"
+    print("  ✓ 重试后取得数据")
+    
+    print("3. 4xx错误不重试...")
+    for status_code in (400, 401, 404):
+        client = FlakyKlineClient(available=300, status_codes=[status_code])
+        fetcher = DataFetcher(client)
+        delays = _record_backoff(fetcher)
+        try:
+            fetcher.get_klines("ETHUSDT", "1m", limit=10)
+            assert False, f"{status_code}应直接抛出异常"
+        except APIError:
+            pass
+        assert len(client.calls) == 1 and not delays, f"{status_code}不应重试"
+    print("  ✓ 4xx请求错误直接放弃")
+    
+    print("4. 429限流按Retry-After重试...")
+    client = FlakyKlineClient(available=300, status_codes=[429], retry_after=2.5)
+    fetcher = DataFetcher(client)
+    delays = _record_backoff(fetcher)
+    fetcher.get_klines("ETHUSDT", "1m", limit=10)
+    assert len(client.calls) == 2, "429应重试"
+    assert delays == [(0, 2.5)], "Retry-After未传给退避计算"
+    print("  ✓ 429限流重试")
+    
+    print("5. 退避延迟范围...")
+    fetcher = DataFetcher(FakeKlineClient(available=0))
+    for attempt in range(10):
+        base = min(fetcher.retry_max_delay, (2 ** attempt) * fetcher.retry_base_delay)
+        for _ in range(50):
+            delay = fetcher._backoff_delay(attempt)
+            assert base <= delay <= base * 1.5, f"第{attempt}次退避延迟{delay}超出范围"
+    assert fetcher._backoff_delay(0, retry_after=5.0) == 5.0, "延迟应不小于Retry-After"
+    assert 0.25 <= fetcher._backoff_delay(2, retry_after=0.1) <= 1.5, "Retry-After较小时应按退避延迟"
+    print("  ✓ 抖动与Retry-After范围正确")
+
+
+def test_parameter_config_from_dict():
+    """测试从字典加载参数配置"""
+    from parameter_config import ParameterConfig
+    
+    print("1. 测试普通参数加载...")
+    config = ParameterConfig()
+    default_lookback = config.fvg_strategy.fvg_detection_lookback
+    config.from_dict({
+        'fvg_strategy': {'min_fvg_quality': 0.8},
+        'liquidity_analyzer': {},
+        'unknown_section': {'x': 1},
+    })
+    assert config.fvg_strategy.min_fvg_quality == 0.8, "参数未加载"
+    assert config.fvg_strategy.fvg_detection_lookback == default_lookback, "未提供的参数不应改变"
+    assert not hasattr(config, 'unknown_section'), "未知分区不应加载"
+    print("  ✓ 普通参数加载正确")
+    
+    print("2. 测试列表和字典参数的类型检查...")
+    config.from_dict({
+        'fvg_strategy': {'timeframes': '1m', 'timeframe_weights': ['1m']},
+        'liquidity_analyzer': {'liquidity_timeframes': ['1h', '4h']},
+    })
+    assert config.fvg_strategy.timeframes == ['5m', '15m', '1h'], "类型错误的列表参数不应加载"
+    assert config.fvg_strategy.timeframe_weights == {'5m': 1.0, '15m': 2.0, '1h': 3.0}, "类型错误的字典参数不应加载"
+    assert config.liquidity_analyzer.liquidity_timeframes == ['1h', '4h'], "类型正确的列表参数未加载"
+    print("  ✓ 类型不符的值被忽略")
+    
+    print("3. 测试导出后重新加载...")
+    restored = ParameterConfig()
+    restored.from_dict(config.to_dict())
+    assert restored.to_dict() == config.to_dict(), "重新加载结果不一致"
+    print("  ✓ 导出和加载一致")
+
+
+def test_param_converter():
+    """测试参数输入框的文本转换"""
+    from fvg_liquidity_gui import _make_param_converter
+    
+    print("1. 测试布尔参数...")
+    convert = _make_param_converter(True)
+    assert convert(" Yes ") is True and convert("1") is True, "布尔真值转换错误"
+    assert convert("false") is False and convert("0") is False, "布尔假值转换错误"
+    print("  ✓ 布尔转换正确")
+    
+    print("2. 测试数值参数...")
+    assert _make_param_converter(3)("5") == 5 and isinstance(_make_param_converter(3)("5"), int), "整数转换错误"
+    assert _make_param_converter(0.5)("0.75") == 0.75, "浮点数转换错误"
+    try:
+        _make_param_converter(3)("abc")
+        assert False, "非法数值应抛出异常"
+    except ValueError:
+        pass
+    print("  ✓ 数值转换正确")
+    
+    print("3. 测试列表、字典和字符串参数...")
+    assert _make_param_converter([])("['1m', '5m']") == ['1m', '5m'], "列表转换错误"
+    assert _make_param_converter({})("{'1m': 1.0}") == {'1m': 1.0}, "字典转换错误"
+    assert _make_param_converter('5m')("1h") == "1h", "字符串转换错误"
+    assert _make_param_converter(None)("abc") == "abc", "不存在的配置项应按字符串处理"
+    print("  ✓ 其他类型转换正确")
+
+
 def test_api_connection():
     """测试API连接"""
     print("注意：此测试需要有效的网络连接和币安API访问权限")
@@ -410,10 +812,20 @@ def main():
     # 5. 测试多周期分析器
     runner.run_test("多周期分析器功能", test_multi_timeframe_analyzer)
     
-    # 6. 测试API连接（可选）
+    # 6. 测试数据层（模拟接口）
+    runner.run_test("增量K线拼接", test_merge_klines)
+    runner.run_test("K线增量刷新", test_kline_incremental_refresh)
+    runner.run_test("K线全量回退", test_kline_incremental_fallback)
+    runner.run_test("K线并发请求合并", test_kline_single_flight)
+    runner.run_test("合约列表磁盘缓存", test_contract_cache)
+    runner.run_test("请求重试与退避", test_retry_backoff)
+    runner.run_test("参数配置字典加载", test_parameter_config_from_dict)
+    runner.run_test("参数输入转换", test_param_converter)
+    
+    # 7. 测试API连接（可选）
     runner.run_test("API连接测试", test_api_connection)
     
-    # 7. 测试系统集成（可选）
+    # 8. 测试系统集成（可选）
     runner.run_test("系统集成测试", test_integration)
     
     # 打印测试总结